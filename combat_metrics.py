@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any, Mapping
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CombatMetric:
     field: str
     max_field: str
@@ -148,6 +148,8 @@ def metric_conflict_warning(combatant: Mapping[str, Any], metric: CombatMetric)
 
 
 def coerce_metric_int(value: Any, default: int = 0) -> int:
+    if type(value) is int:  # the common case once a combatant is live; excludes bool
+        return value
     if isinstance(value, bool):
         return default
     try:
@@ -1,11 +1,14 @@
 from __future__ import annotations
 from PySide6 import QtWidgets, QtGui, QtCore
 from typing import Dict, List, Any
-import json
-from copy import deepcopy
-from uuid import uuid4
+import re
+from itertools import islice
+from pathlib import Path
 
-from helpers import load_json, roll_d20, write_json, collect_suffixes, next_suffix
+from helpers import (
+    atomic_write_bytes, clone_json, json_bytes, json_loads, json_signature, load_json, roll_d20s,
+    write_json, collect_suffixes, iter_suffixes, next_suffix, uuid4_strs,
+)
 from app_paths import PARTY_FP, SESSION_ROSTER_FP
 from combat_metrics import (
     coerce_metric_int,
@@ -27,12 +30,15 @@ COMBAT_INSTANCE_ID_FIELD = "_combat_instance_id"
 def ensure_live_combat_instance_ids(combatants: List[Dict]) -> None:
     """Assign unique live-instance IDs without touching source documents."""
     used: set[str] = set()
+    missing: List[Dict] = []
     for combatant in combatants:
         value = combatant.get(COMBAT_INSTANCE_ID_FIELD)
         if not isinstance(value, str) or not value.strip() or value in used:
-            value = str(uuid4())
-            combatant[COMBAT_INSTANCE_ID_FIELD] = value
-        used.add(value)
+            missing.append(combatant)
+        else:
+            used.add(value)
+    for combatant, value in zip(missing, uuid4_strs(len(missing))):
+        combatant[COMBAT_INSTANCE_ID_FIELD] = value
 
 
 def live_combatant_index(combatants: List[Dict], instance_id: str | None) -> int:
@@ -48,6 +54,12 @@ def live_combatant_index(combatants: List[Dict], instance_id: str | None) -> int
     )
 
 
+def initiative_sort_key(combatant: Dict) -> tuple:
+    """Highest initiative first, unrolled combatants last, then by name."""
+    total = combatant.get("initTotal")
+    return (total is None, -(total or 0), (combatant.get("name") or "").lower())
+
+
 def combat_row_height(width: int, has_secondary: bool = False) -> int:
     """Single-line operational row height at standard application scaling."""
     return 40
@@ -127,13 +139,33 @@ def combat_row_geometry(
     }
 
 
+# Row accents keyed by the GM UI dark-mode flag, parsed once instead of per paint.
+_ACTIVE_ACCENTS = {True: QtGui.QColor("#d6a34a"), False: QtGui.QColor("#9a6700")}
+_FRIENDLY_ACCENTS = {True: QtGui.QColor("#6f9b78"), False: QtGui.QColor("#43744d")}
+_ENEMY_ACCENTS = {True: QtGui.QColor("#a56d6d"), False: QtGui.QColor("#8a4b4b")}
+
+# Enum values the row delegate uses on every paint, resolved once at import.
+_ALIGN_CENTER = QtCore.Qt.AlignmentFlag.AlignCenter
+_ALIGN_VCENTER = QtCore.Qt.AlignmentFlag.AlignVCenter
+_ALIGN_LEFT_VCENTER = QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter
+_ALIGN_RIGHT_VCENTER = QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter
+_ELIDE_RIGHT = QtCore.Qt.TextElideMode.ElideRight
+_STATE_SELECTED = QtWidgets.QStyle.StateFlag.State_Selected
+_STATE_MOUSE_OVER = QtWidgets.QStyle.StateFlag.State_MouseOver
+_ROLE_BASE = QtGui.QPalette.ColorRole.Base
+_ROLE_TEXT = QtGui.QPalette.ColorRole.Text
+_ROLE_MID = QtGui.QPalette.ColorRole.Mid
+_ROLE_HIGHLIGHT = QtGui.QPalette.ColorRole.Highlight
+_ROLE_PLACEHOLDER = QtGui.QPalette.ColorRole.PlaceholderText
+
+
 def _color_with_alpha(color: QtGui.QColor, alpha: int) -> QtGui.QColor:
     result = QtGui.QColor(color)
     result.setAlpha(alpha)
     return result
 
 
-class CombatListWidget(QtWidgets.QListWidget):
+class CombatListView(QtWidgets.QListView):
     viewportResized = QtCore.Signal()
 
     def resizeEvent(self, event):
@@ -142,7 +174,8 @@ class CombatListWidget(QtWidgets.QListWidget):
 
     def paintEvent(self, event):
         super().paintEvent(event)
-        if self.count():
+        model = self.model()
+        if model is not None and model.rowCount():
             return
         painter = QtGui.QPainter(self.viewport())
         painter.setRenderHint(QtGui.QPainter.RenderHint.TextAntialiasing)
@@ -172,15 +205,147 @@ class ElidedLabel(QtWidgets.QLabel):
         )
 
 
+class CombatantsModel(QtCore.QAbstractListModel):
+    """List model over ``CombatTab.combatants``; row data is computed on demand."""
+
+    def __init__(self, tab: "CombatTab"):
+        super().__init__(tab)
+        self.tab = tab
+        # Row text backs tooltips, accessibility and keyboard search; build it
+        # on first request and drop it when the row changes or the model resets.
+        self._text_cache: Dict[int, str] = {}
+        self.modelReset.connect(self._text_cache.clear)
+        # The combatant dicts shown at the last reset, to tell edits from reorders.
+        self._rows: List[Dict] = []
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def entity(self, row: int) -> Dict | None:
+        rows = self._rows
+        return rows[row] if 0 <= row < len(rows) else None
+
+    def accessible_text(self, row: int) -> str:
+        cached = self._text_cache.get(row)
+        if cached is None:
+            cached = self._text_cache[row] = self._build_accessible_text(row)
+        return cached
+
+    def _build_accessible_text(self, row: int) -> str:
+        m = self.entity(row)
+        if m is None:
+            return ""
+        metric = resolve_combat_metric(m)
+        current, maximum = metric_values(m, metric)
+        statuses = [str(status) for status in (m.get("statuses") or []) if str(status)]
+        secondary = resolve_secondary_combat_metric(m)
+        accessible_parts = [
+            f"{row + 1}. {m.get('name', 'Unnamed combatant')}",
+            "Current turn" if row == self.tab.turn_index else "",
+            f"Side {m.get('side', 'Enemy')}",
+            f"Initiative {m.get('initTotal', '—')}",
+            f"{metric.label} {current} of {maximum}",
+        ]
+        if secondary and secondary.field in m:
+            secondary_current, secondary_maximum = metric_values(m, secondary)
+            accessible_parts.append(
+                f"{secondary.label} {secondary_current} of {secondary_maximum}"
+            )
+        if statuses:
+            accessible_parts.append("Conditions " + ", ".join(statuses))
+        return ". ".join(part for part in accessible_parts if part)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        m = self.entity(index.row()) if index.isValid() else None
+        if m is None:
+            return None
+        row = index.row()
+        if role in (
+            QtCore.Qt.ItemDataRole.DisplayRole,
+            QtCore.Qt.ItemDataRole.ToolTipRole,
+            QtCore.Qt.ItemDataRole.AccessibleTextRole,
+        ):
+            return self.accessible_text(row)
+        if role == COMBAT_ENTITY_ROLE:
+            return m
+        if role == COMBAT_ACTIVE_ROLE:
+            return row == self.tab.turn_index
+        if role == COMBAT_ROW_INDEX_ROLE:
+            return row
+        if role == COMBAT_PORTRAIT_ROLE:
+            return self.tab._combatant_portrait(m)
+        return None
+
+    def rows_unchanged(self) -> bool:
+        """True when the same combatants are listed in the same order as at the last reset."""
+        combatants = self.tab.combatants
+        return len(combatants) == len(self._rows) and all(
+            a is b for a, b in zip(combatants, self._rows)
+        )
+
+    def reset_rows(self):
+        self.beginResetModel()
+        self._rows = list(self.tab.combatants)
+        self.endResetModel()
+
+    def sync_rows(self) -> bool:
+        """Apply appended or removed combatants as row inserts/removes.
+
+        Returns False when rows were reordered or replaced and need a reset."""
+        old, new = self._rows, self.tab.combatants
+        if len(new) > len(old):
+            if any(a is not b for a, b in zip(old, new)):
+                return False
+            self.beginInsertRows(QtCore.QModelIndex(), len(old), len(new) - 1)
+            self._rows = list(new)
+            self.endInsertRows()
+        elif len(new) < len(old):
+            ranges: List[List[int]] = []
+            kept = 0
+            for row, entity in enumerate(old):
+                if kept < len(new) and new[kept] is entity:
+                    kept += 1
+                elif ranges and ranges[-1][1] == row - 1:
+                    ranges[-1][1] = row
+                else:
+                    ranges.append([row, row])
+            if kept != len(new):
+                return False
+            for first, last in reversed(ranges):
+                self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+                del self._rows[first:last + 1]
+                self.endRemoveRows()
+        else:
+            return False
+        # Cached text is keyed by row and carries the turn marker; rebuild on demand.
+        self._text_cache.clear()
+        return True
+
+    def refresh_rows(self, first: int, last: int | None = None):
+        last = first if last is None else last
+        first = max(0, first)
+        last = min(last, self.rowCount() - 1)
+        combatants = self.tab.combatants
+        for row in range(first, last + 1):
+            # Edits may swap in a new dict for the row; show the current one.
+            if row < len(combatants):
+                self._rows[row] = combatants[row]
+            self._text_cache.pop(row, None)
+        if first <= last:
+            self.dataChanged.emit(self.index(first), self.index(last))
+
+
 class CombatRowDelegate(QtWidgets.QStyledItemDelegate):
     """Compact operational combat row with production geometry hit testing."""
 
     def __init__(self, tab: "CombatTab"):
         super().__init__(tab.listCombat)
         self.tab = tab
+        # (statuses, width, font) -> fitted condition text; fitting measures every candidate.
+        self._condition_cache: Dict[tuple, str] = {}
 
     def sizeHint(self, option, index):
-        entity = index.data(COMBAT_ENTITY_ROLE) or {}
+        entity = self.tab.combat_model.entity(index.row()) or {}
         secondary = resolve_secondary_combat_metric(entity)
         has_secondary = bool(secondary and secondary.field in entity)
         width = self.tab.listCombat.viewport().width()
@@ -206,26 +371,27 @@ class CombatRowDelegate(QtWidgets.QStyledItemDelegate):
         )
 
     def paint(self, painter, option, index):
-        entity = index.data(COMBAT_ENTITY_ROLE) or {}
-        active = bool(index.data(COMBAT_ACTIVE_ROLE))
-        selected = bool(option.state & QtWidgets.QStyle.StateFlag.State_Selected)
-        hovered = bool(option.state & QtWidgets.QStyle.StateFlag.State_MouseOver)
+        entity = self.tab.combat_model.entity(index.row()) or {}
+        active = index.row() == self.tab.turn_index
+        selected = bool(option.state & _STATE_SELECTED)
+        hovered = bool(option.state & _STATE_MOUSE_OVER)
         geometry = combat_row_geometry(option.rect)
         card = geometry["card"]
         palette = option.palette
-        base = palette.color(QtGui.QPalette.ColorRole.Base)
-        text = palette.color(QtGui.QPalette.ColorRole.Text)
-        accent = QtGui.QColor("#d6a34a" if self.tab.parent.ui_dark else "#9a6700")
-        selection = palette.color(QtGui.QPalette.ColorRole.Highlight)
+        base = palette.color(_ROLE_BASE)
+        text = palette.color(_ROLE_TEXT)
+        dark = bool(self.tab.parent.ui_dark)
+        accent = _ACTIVE_ACCENTS[dark]
+        selection = palette.color(_ROLE_HIGHLIGHT)
         side_value = str(entity.get("side") or "Enemy").strip().casefold()
         friendly = side_value in {"friendly", "ally", "allies"}
         enemy = side_value in {"enemy", "opponent", "opponents"}
         side_accent = (
-            QtGui.QColor("#6f9b78" if self.tab.parent.ui_dark else "#43744d")
+            _FRIENDLY_ACCENTS[dark]
             if friendly
-            else QtGui.QColor("#a56d6d" if self.tab.parent.ui_dark else "#8a4b4b")
+            else _ENEMY_ACCENTS[dark]
             if enemy
-            else palette.color(QtGui.QPalette.ColorRole.Mid)
+            else palette.color(_ROLE_MID)
         )
         side_label = "A" if friendly else "E" if enemy else "N"
 
@@ -237,11 +403,11 @@ class CombatRowDelegate(QtWidgets.QStyledItemDelegate):
         elif selected:
             background = _color_with_alpha(selection, 48)
         elif hovered:
-            background = _color_with_alpha(palette.color(QtGui.QPalette.ColorRole.Mid), 40)
+            background = _color_with_alpha(palette.color(_ROLE_MID), 40)
         painter.setBrush(background)
         painter.setPen(QtCore.Qt.PenStyle.NoPen)
         painter.drawRect(card)
-        painter.setPen(QtGui.QPen(_color_with_alpha(palette.color(QtGui.QPalette.ColorRole.Mid), 110), 1))
+        painter.setPen(QtGui.QPen(_color_with_alpha(palette.color(_ROLE_MID), 110), 1))
         painter.drawLine(card.bottomLeft(), card.bottomRight())
         if selected:
             painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
@@ -254,7 +420,7 @@ class CombatRowDelegate(QtWidgets.QStyledItemDelegate):
             painter.setFont(active_font)
             painter.drawText(
                 geometry["indicator"],
-                QtCore.Qt.AlignmentFlag.AlignCenter,
+                _ALIGN_CENTER,
                 "▶",
             )
 
@@ -263,10 +429,10 @@ class CombatRowDelegate(QtWidgets.QStyledItemDelegate):
         side_font.setBold(True)
         side_font.setPointSizeF(max(8.0, side_font.pointSizeF() - 1))
         painter.setFont(side_font)
-        painter.drawText(geometry["side"], QtCore.Qt.AlignmentFlag.AlignCenter, side_label)
+        painter.drawText(geometry["side"], _ALIGN_CENTER, side_label)
 
         portrait = geometry["portrait"]
-        pixmap = index.data(COMBAT_PORTRAIT_ROLE)
+        pixmap = self.tab._combatant_portrait(entity)
         if isinstance(pixmap, QtGui.QPixmap) and not pixmap.isNull():
             clipped = pixmap.scaled(
                 portrait.size(),
@@ -283,8 +449,8 @@ class CombatRowDelegate(QtWidgets.QStyledItemDelegate):
             painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
             painter.setPen(QtGui.QPen(_color_with_alpha(side_accent, 150), 1))
             painter.drawRoundedRect(portrait, 3, 3)
-            painter.setPen(palette.color(QtGui.QPalette.ColorRole.PlaceholderText))
-            painter.drawText(portrait, QtCore.Qt.AlignmentFlag.AlignCenter, "—")
+            painter.setPen(palette.color(_ROLE_PLACEHOLDER))
+            painter.drawText(portrait, _ALIGN_CENTER, "—")
         painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
         painter.setPen(QtGui.QPen(side_accent, 1))
         painter.drawRoundedRect(portrait, 3, 3)
@@ -298,18 +464,18 @@ class CombatRowDelegate(QtWidgets.QStyledItemDelegate):
         name_metrics = QtGui.QFontMetrics(font)
         painter.drawText(
             geometry["name"],
-            QtCore.Qt.AlignmentFlag.AlignVCenter,
+            _ALIGN_VCENTER,
             name_metrics.elidedText(
-                name, QtCore.Qt.TextElideMode.ElideRight, geometry["name"].width()
+                name, _ELIDE_RIGHT, geometry["name"].width()
             ),
         )
 
         initiative = entity.get("initTotal")
         painter.setFont(option.font)
-        painter.setPen(palette.color(QtGui.QPalette.ColorRole.PlaceholderText))
+        painter.setPen(palette.color(_ROLE_PLACEHOLDER))
         painter.drawText(
             geometry["initiative"],
-            QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter,
+            _ALIGN_RIGHT_VCENTER,
             f"Init {initiative if initiative is not None else '—'}",
         )
         primary_metric = resolve_combat_metric(entity)
@@ -321,26 +487,31 @@ class CombatRowDelegate(QtWidgets.QStyledItemDelegate):
         painter.setPen(text)
         painter.drawText(
             geometry["primary"],
-            QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter,
+            _ALIGN_LEFT_VCENTER,
             QtGui.QFontMetrics(metric_font).elidedText(
                 metric_text,
-                QtCore.Qt.TextElideMode.ElideRight,
+                _ELIDE_RIGHT,
                 geometry["primary"].width(),
             ),
         )
         condition_font = QtGui.QFont(option.font)
         condition_font.setPointSizeF(max(8.0, condition_font.pointSizeF() - 0.5))
         painter.setFont(condition_font)
-        painter.setPen(palette.color(QtGui.QPalette.ColorRole.Text))
-        condition_metrics = QtGui.QFontMetrics(condition_font)
-        condition_text = self.condition_summary(
-            entity.get("statuses") or [],
-            geometry["conditions"].width(),
-            condition_metrics,
-        )
+        painter.setPen(palette.color(_ROLE_TEXT))
+        statuses = tuple(str(value) for value in entity.get("statuses") or ())
+        condition_key = (statuses, geometry["conditions"].width(), condition_font.key())
+        condition_text = self._condition_cache.get(condition_key)
+        if condition_text is None:
+            if len(self._condition_cache) >= 256:
+                self._condition_cache.clear()
+            condition_text = self._condition_cache[condition_key] = self.condition_summary(
+                statuses,
+                geometry["conditions"].width(),
+                QtGui.QFontMetrics(condition_font),
+            )
         painter.drawText(
             geometry["conditions"],
-            QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter,
+            _ALIGN_LEFT_VCENTER,
             condition_text,
         )
         painter.restore()
@@ -369,6 +540,14 @@ def parse_party_document(data: Any) -> tuple[Dict, List[Dict], int, int]:
 
 class CombatTab(QtWidgets.QWidget):
     progressionChanged = QtCore.Signal()
+    partyWriteFailed = QtCore.Signal(str)
+    partyFileWritten = QtCore.Signal(object, bytes, object)  # path, data, mtime_ns or None on failure
+
+    # Default HP guesses for quick-added creatures, matched anywhere in the
+    # name so "Hobgoblin" or "Skeletons" still count. Edit after adding.
+    _HP_LOW_RE = re.compile("goblin|kobold|skeleton")
+    _HP_HIGH_RE = re.compile("dragon|giant|troll")
+    _HP_DEFAULT = 10
 
     def __init__(self, parent: QtWidgets.QMainWindow):
         super().__init__()
@@ -381,6 +560,19 @@ class CombatTab(QtWidgets.QWidget):
         self._party_write_warning_shown = False
         self._metric_conflict_warnings = set()
         self._combat_portrait_cache: Dict[str, QtGui.QPixmap | None] = {}
+        self._refreshing_combat_list = False
+        # Coalesce bursts of edits (HP clicks, turn advances) into one party write.
+        self._persist_timer = QtCore.QTimer(self)
+        self._persist_timer.setSingleShot(True)
+        self._persist_timer.setInterval(250)
+        self._persist_timer.timeout.connect(self._persist_party_now)
+        # One writer thread keeps disk I/O off the UI thread and in submission order.
+        self._write_pool = QtCore.QThreadPool(self)
+        self._write_pool.setMaxThreadCount(1)
+        # path -> (last bytes submitted, mtime_ns once written) for skipping no-op writes
+        self._written_party_files: Dict[Path, tuple] = {}
+        self.partyWriteFailed.connect(self.parent._toast)
+        self.partyFileWritten.connect(self._on_party_file_written)
         
         self._build_ui()
         self._wire_signals()
@@ -446,14 +638,17 @@ class CombatTab(QtWidgets.QWidget):
         v_layout.addLayout(h_tools)
         
         # Combat List
-        self.listCombat = CombatListWidget()
+        self.combat_model = CombatantsModel(self)
+        self.listCombat = CombatListView()
+        self.listCombat.setProperty("panelList", True)
+        self.listCombat.setModel(self.combat_model)
         self.listCombat.setAccessibleName("Combatants")
         self.listCombat.setAccessibleDescription(
             "Combatant rows. Active turn, selection, and hover are shown independently."
         )
         self.listCombat.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         self.listCombat.setAlternatingRowColors(False)
-        self.listCombat.setUniformItemSizes(False)
+        self.listCombat.setUniformItemSizes(True)
         self.listCombat.setWordWrap(False)
         self.listCombat.setMouseTracking(True)
         self.listCombat.setVerticalScrollMode(
@@ -553,7 +748,9 @@ class CombatTab(QtWidgets.QWidget):
         self.btnEdit.clicked.connect(self._edit_selected)
         self.btnStatuses.clicked.connect(self._edit_statuses_selected)
         self.btnMakeCurrent.clicked.connect(self._make_selected_current)
-        self.listCombat.itemSelectionChanged.connect(self._on_combat_selection_changed)
+        self.listCombat.selectionModel().selectionChanged.connect(
+            self._on_combat_selection_changed
+        )
         self.listCombat.customContextMenuRequested.connect(self._open_combat_context_menu)
         self.listCombat.viewportResized.connect(self._resize_combat_rows)
         self.btnRollInit.clicked.connect(self._roll_initiative_all)
@@ -585,28 +782,35 @@ class CombatTab(QtWidgets.QWidget):
         if not name or not count:
             return
         
-        # Better defaults: use reasonable HP based on common creature types
-        # You can always edit them after adding
-        default_hp = 10  # Reasonable default for most creatures
-        if any(word in name.lower() for word in ["goblin", "kobold", "skeleton"]):
+        lowered = name.lower()
+        if self._HP_LOW_RE.search(lowered):
             default_hp = 7
-        elif any(word in name.lower() for word in ["dragon", "giant", "troll"]):
+        elif self._HP_HIGH_RE.search(lowered):
             default_hp = 50
-        
-        for i in range(count):
-            display_name = name if count == 1 else f"{name} ({chr(65+i)})"
-            self.combatants.append({
-                "name": display_name,
-                "hp": default_hp,
-                "hpMax": default_hp,
-                "initMod": 0,
-                "initTotal": None,
-                "notes": "",
-                "statuses": [],
-                "portrait": None,
-                "side": "Enemy",
-                "isPC": False,
-            })
+        else:
+            default_hp = self._HP_DEFAULT
+
+        template = {
+            "name": name,
+            "hp": default_hp,
+            "hpMax": default_hp,
+            "initMod": 0,
+            "initTotal": None,
+            "notes": "",
+            "statuses": [],
+            "portrait": None,
+            "side": "Enemy",
+            "isPC": False,
+        }
+        if count == 1:
+            self.combatants.append(template)
+        else:
+            # Scan live names once; suffixes already in use are skipped, not re-checked per copy.
+            taken = collect_suffixes(name, [m.get("name") or "" for m in self.combatants])
+            self.combatants.extend(
+                dict(template, name=f"{name} ({suffix})", statuses=[])
+                for suffix in islice((s for s in iter_suffixes() if s not in taken), count)
+            )
         ensure_live_combat_instance_ids(self.combatants)
         self._refresh_combat_list()
         self._persist_party()
@@ -615,7 +819,6 @@ class CombatTab(QtWidgets.QWidget):
     
     def _create_character(self):
         """Open character creation dialog with sensible defaults."""
-        from gm_window import EntityDialog
         # Default to a friendly character with reasonable HP
         default_data = {
             "name": "New Character",
@@ -629,7 +832,7 @@ class CombatTab(QtWidgets.QWidget):
             "side": "Friendly",
             "isPC": True,
         }
-        d = EntityDialog(self.parent, data=default_data)
+        d = self.parent._EntityDialog(self.parent, data=default_data)
         if d.exec():
             payload = d.payload()
             self.combatants.append(payload)
@@ -648,55 +851,62 @@ class CombatTab(QtWidgets.QWidget):
         if search is not None:
             search.setFocus()
 
+    def _selected_combat_rows(self) -> List[int]:
+        """Selected row numbers, one per row, in selection order."""
+        return [index.row() for index in self.listCombat.selectionModel().selectedRows()]
+
     def _edit_selected(self):
-        rows = self.listCombat.selectedIndexes()
+        rows = self._selected_combat_rows()
         if not rows: return
-        CombatTab._edit_combatant(self, rows[0].row())
+        CombatTab._edit_combatant(self, rows[0])
 
     def _edit_combatant(self, idx: int):
         if not (0 <= idx < len(self.combatants)): return
 
         data = self.combatants[idx]
         # EntityDialog is defined in gm_window.py, access via parent
-        from gm_window import EntityDialog
-        d = EntityDialog(self.parent, data=data)
+        d = self.parent._EntityDialog(self.parent, data=data)
         if d.exec():
             payload = d.payload()
             self.combatants[idx] = payload
-            self._refresh_combat_list()
+            self._warn_metric_conflicts()
+            self._refresh_combat_rows(idx)
             self._persist_party()
             self.parent._log(f"Edited combatant: {payload['name']}")
 
     def _set_current_turn(self, idx: int):
         if not (0 <= idx < len(self.combatants)):
             return
+        previous = self.turn_index
         self.turn_index = idx
-        self._refresh_combat_list()
+        self._refresh_combat_rows(previous, idx)
         self._persist_party()
         self.parent._log(f"Current turn set to: {self.combatants[idx].get('name', '?')}")
 
     def _make_selected_current(self):
-        rows = self.listCombat.selectedIndexes()
+        rows = self._selected_combat_rows()
         if rows:
-            self._set_current_turn(rows[0].row())
+            self._set_current_turn(rows[0])
 
     def _open_combat_context_menu(self, position: QtCore.QPoint):
-        item = self.listCombat.itemAt(position)
-        if item is None:
+        index = self.listCombat.indexAt(position)
+        if not index.isValid():
             return
         self._show_combatant_menu(
-            self.listCombat.row(item),
+            index.row(),
             self.listCombat.viewport().mapToGlobal(position),
         )
 
     def _show_combatant_menu(self, idx: int, global_position: QtCore.QPoint):
         if not (0 <= idx < len(self.combatants)):
             return
-        item = self.listCombat.item(idx)
-        if item is not None and not item.isSelected():
-            self.listCombat.clearSelection()
-            item.setSelected(True)
-            self.listCombat.setCurrentItem(item)
+        index = self.combat_model.index(idx)
+        selection = self.listCombat.selectionModel()
+        if not selection.isSelected(index):
+            selection.setCurrentIndex(
+                index,
+                QtCore.QItemSelectionModel.SelectionFlag.ClearAndSelect,
+            )
         menu = QtWidgets.QMenu(self)
         edit = menu.addAction("Edit")
         current = menu.addAction("Make Current")
@@ -731,7 +941,7 @@ class CombatTab(QtWidgets.QWidget):
             self._remove_selected()
     
     def _remove_selected(self):
-        rows = sorted([i.row() for i in self.listCombat.selectedIndexes()], reverse=True)
+        rows = sorted(self._selected_combat_rows(), reverse=True)
         if not rows: return
         current_id = (
             self.combatants[self.turn_index].get(COMBAT_INSTANCE_ID_FIELD)
@@ -753,24 +963,29 @@ class CombatTab(QtWidgets.QWidget):
         self.parent._log(f"Removed combatants: {', '.join(removed_names)}")
 
     def _duplicate_selected(self):
-        rows = sorted([i.row() for i in self.listCombat.selectedIndexes()])
+        rows = sorted(self._selected_combat_rows())
         if not rows: return
         
         new_items = []
+        all_names = [m.get("name") or "" for m in self.combatants]
+        taken_by_base: Dict[str, set] = {}
         for r in rows:
             if 0 <= r < len(self.combatants):
                 original = self.combatants[r]
-                new_item = json.loads(json.dumps(original))
+                new_item = clone_json(original)
                 new_item.pop(COMBAT_INSTANCE_ID_FIELD, None)
-                
-                all_names = [m.get("name") for m in self.combatants]
-                base_name = original.get("name").split(" (")[0]
-                suffixes = collect_suffixes(base_name, all_names)
-                suffix = next_suffix(suffixes)
-                
+
+                base_name = (original.get("name") or "").partition(" (")[0]
+                # Scan names once per base, then track suffixes issued in this batch.
+                taken = taken_by_base.get(base_name)
+                if taken is None:
+                    taken = taken_by_base[base_name] = collect_suffixes(base_name, all_names)
+                suffix = next_suffix(taken)
+                taken.add(suffix)
+
                 new_item["name"] = f"{base_name} ({suffix})"
                 new_items.append(new_item)
-        
+
         self.combatants.extend(new_items)
         ensure_live_combat_instance_ids(self.combatants)
         self._refresh_combat_list()
@@ -793,49 +1008,68 @@ class CombatTab(QtWidgets.QWidget):
 
     def _refresh_combat_list(self):
         self._warn_metric_conflicts()
+        if self.combat_model.rows_unchanged():
+            # Only row contents changed: repaint in place and keep selection and scroll as they are.
+            self.combat_model.refresh_rows(0, len(self.combatants) - 1)
+            self._update_combat_hud()
+            self._sync_selected_strip()
+            return
+        self._refreshing_combat_list = True
+        try:
+            synced = self.combat_model.sync_rows()
+        finally:
+            self._refreshing_combat_list = False
+        if synced:
+            # Added or removed rows only: Qt shifts selection and scroll; turn markers may move.
+            self.combat_model.refresh_rows(0, len(self.combatants) - 1)
+            self._update_combat_hud()
+            self._sync_selected_strip()
+            return
+        selection = self.listCombat.selectionModel()
+        selected_rows = set(self._selected_combat_rows())
         selected_entities = {
-            id(self.combatants[index.row()])
-            for index in self.listCombat.selectedIndexes()
-            if 0 <= index.row() < len(self.combatants)
+            id(self.combatants[row])
+            for row in selected_rows
+            if 0 <= row < len(self.combatants)
         }
-        selected_rows = {
-            index.row() for index in self.listCombat.selectedIndexes()
-        }
-        current_row = self.listCombat.currentRow()
-        scroll_position = self.listCombat.verticalScrollBar().value()
-        while self.listCombat.count() > len(self.combatants):
-            self.listCombat.takeItem(self.listCombat.count() - 1)
-        for i, m in enumerate(self.combatants):
-            self._update_combat_row(i)
-        self.listCombat.clearSelection()
-        restored_identity = False
-        for i, entity in enumerate(self.combatants):
-            if id(entity) in selected_entities:
-                self.listCombat.item(i).setSelected(True)
-                restored_identity = True
-        if not restored_identity:
-            for row in selected_rows:
-                if 0 <= row < self.listCombat.count():
-                    self.listCombat.item(row).setSelected(True)
-        if 0 <= current_row < self.listCombat.count():
-            self.listCombat.setCurrentRow(
-                current_row,
-                QtCore.QItemSelectionModel.SelectionFlag.NoUpdate,
-            )
-        self.listCombat.verticalScrollBar().setValue(scroll_position)
-        self.listCombat.viewport().update()
+        current_row = self.listCombat.currentIndex().row()
+        scrollbar = self.listCombat.verticalScrollBar()
+        scroll_position = scrollbar.value()
+        # Reset, reselect and scroll as one repaint; the selected strip is
+        # synced once below rather than from the restored selection signal.
+        self.listCombat.setUpdatesEnabled(False)
+        self._refreshing_combat_list = True
+        try:
+            self.combat_model.reset_rows()
+            restore = QtCore.QItemSelection()
+            restored_rows = [
+                i for i, entity in enumerate(self.combatants)
+                if id(entity) in selected_entities
+            ] or [row for row in selected_rows if 0 <= row < len(self.combatants)]
+            for row in restored_rows:
+                index = self.combat_model.index(row)
+                restore.select(index, index)
+            selection.select(restore, QtCore.QItemSelectionModel.SelectionFlag.Select)
+            if 0 <= current_row < len(self.combatants):
+                selection.setCurrentIndex(
+                    self.combat_model.index(current_row),
+                    QtCore.QItemSelectionModel.SelectionFlag.NoUpdate,
+                )
+            if scrollbar.value() != scroll_position:
+                scrollbar.setValue(scroll_position)
+        finally:
+            self._refreshing_combat_list = False
+            self.listCombat.setUpdatesEnabled(True)
         self._update_combat_hud()
         self._sync_selected_strip()
 
     def _combatant_portrait(self, entity: Dict) -> QtGui.QPixmap | None:
-        portrait_signature = json.dumps(
+        portrait_signature = json_signature(
             {
                 "portrait": entity.get("portrait"),
                 "portraits": entity.get("portraits"),
                 "source": entity.get(PORTRAIT_SOURCE_DIR_FIELD),
-            },
-            sort_keys=True,
-            default=str,
+            }
         )
         if portrait_signature not in self._combat_portrait_cache:
             _entry, pixmap, _path = resolve_entity_portrait(entity)
@@ -843,63 +1077,78 @@ class CombatTab(QtWidgets.QWidget):
         return self._combat_portrait_cache[portrait_signature]
 
     def _resize_combat_rows(self):
-        width = self.listCombat.viewport().width()
-        for row in range(self.listCombat.count()):
-            item = self.listCombat.item(row)
-            entity = item.data(COMBAT_ENTITY_ROLE) or {}
-            secondary = resolve_secondary_combat_metric(entity)
-            has_secondary = bool(secondary and secondary.field in entity)
-            item.setSizeHint(QtCore.QSize(0, combat_row_height(width, has_secondary)))
         self.listCombat.doItemsLayout()
 
     def _update_combat_row(self, i: int):
-        if not (0 <= i < len(self.combatants)): return
-        m = self.combatants[i]
-        metric = resolve_combat_metric(m)
-        current, maximum = metric_values(m, metric)
-        statuses = [str(status) for status in (m.get("statuses") or []) if str(status)]
-        secondary = resolve_secondary_combat_metric(m)
-        has_secondary = bool(secondary and secondary.field in m)
-        accessible_parts = [
-            f"{i + 1}. {m.get('name', 'Unnamed combatant')}",
-            "Current turn" if i == self.turn_index else "",
-            f"Side {m.get('side', 'Enemy')}",
-            f"Initiative {m.get('initTotal', '—')}",
-            f"{metric.label} {current} of {maximum}",
-        ]
-        if has_secondary:
-            secondary_current, secondary_maximum = metric_values(m, secondary)
-            accessible_parts.append(
-                f"{secondary.label} {secondary_current} of {secondary_maximum}"
-            )
-        if statuses:
-            accessible_parts.append("Conditions " + ", ".join(statuses))
-        accessible_text = ". ".join(part for part in accessible_parts if part)
+        self.combat_model.refresh_rows(i)
 
-        if i < self.listCombat.count():
-            item = self.listCombat.item(i)
-        else:
-            item = QtWidgets.QListWidgetItem()
-            self.listCombat.addItem(item)
-
-        item.setText(accessible_text)
-        item.setData(QtCore.Qt.ItemDataRole.AccessibleTextRole, accessible_text)
-        item.setData(COMBAT_ENTITY_ROLE, m)
-        item.setData(COMBAT_ACTIVE_ROLE, i == self.turn_index)
-        item.setData(COMBAT_ROW_INDEX_ROLE, i)
-        item.setData(COMBAT_PORTRAIT_ROLE, self._combatant_portrait(m))
-        item.setToolTip(accessible_text)
-        item.setSizeHint(
-            QtCore.QSize(
-                0,
-                combat_row_height(self.listCombat.viewport().width(), has_secondary),
-            )
-        )
+    def _refresh_combat_rows(self, *rows: int):
+        """Repaint only the given rows; the row set and order are unchanged."""
+        for row in set(rows):
+            self._update_combat_row(row)
+        self._update_combat_hud()
+        self._sync_selected_strip()
 
     def _update_combat_hud(self):
         self.progressionChanged.emit()
 
     def _persist_party(self):
+        """Schedule a party write; restarting the timer coalesces rapid edits."""
+        self._persist_timer.start()
+
+    def _flush_persist_party(self):
+        if self._persist_timer.isActive():
+            self._persist_party_now()
+        self._write_pool.waitForDone()
+
+    def _party_file_unchanged(self, path: Path, data: bytes) -> bool:
+        """True when path still holds exactly the bytes this tab last wrote."""
+        last = self._written_party_files.get(path)
+        if last is None or last[1] is None or last[0] != data:
+            return False
+        try:
+            return path.stat().st_mtime_ns == last[1]
+        except OSError:
+            return False
+
+    def _write_party_files(self, writes: List[tuple]):
+        """Encode on the UI thread so the worker never sees live, mutable dicts."""
+        encoded = []
+        for path, document in writes:
+            data = json_bytes(document)
+            if self._party_file_unchanged(path, data):
+                continue
+            self._written_party_files[path] = (data, None)
+            encoded.append((path, data))
+        if not encoded:
+            return
+
+        def run():
+            # Results go back through a queued signal; only the UI thread touches
+            # _written_party_files.
+            for path, data in encoded:
+                try:
+                    atomic_write_bytes(path, data)
+                    mtime = path.stat().st_mtime_ns
+                except OSError as e:
+                    self.partyFileWritten.emit(path, data, None)
+                    self.partyWriteFailed.emit(f"Could not save {path.name}: {e}")
+                    continue
+                self.partyFileWritten.emit(path, data, mtime)
+
+        self._write_pool.start(run)
+
+    def _on_party_file_written(self, path: Path, data: bytes, mtime: int | None):
+        # A newer submission for this path supersedes this record.
+        if self._written_party_files.get(path, (None,))[0] != data:
+            return
+        if mtime is None:
+            self._written_party_files.pop(path, None)
+        else:
+            self._written_party_files[path] = (data, mtime)
+
+    def _persist_party_now(self):
+        self._persist_timer.stop()
         ensure_live_combat_instance_ids(self.combatants)
         current = load_json(PARTY_FP)
         current_document = None
@@ -923,7 +1172,7 @@ class CombatTab(QtWidgets.QWidget):
             "turn_index": self.turn_index,
             "round": self.round,
         })
-        write_json(PARTY_FP, document)
+        writes = [(PARTY_FP, document)]
         self._party_document = dict(document)
         # Auto-save to session roster whenever party changes
         if self.combatants:
@@ -936,13 +1185,15 @@ class CombatTab(QtWidgets.QWidget):
                 self.parent._toast(
                     f"Session roster not saved because {SESSION_ROSTER_FP.name} is invalid."
                 )
+                self._write_party_files(writes)
                 return True
             session_document.update({
                 "roster": self.combatants,
                 "turn_index": self.turn_index,
                 "round": self.round,
             })
-            write_json(SESSION_ROSTER_FP, session_document)
+            writes.append((SESSION_ROSTER_FP, session_document))
+        self._write_party_files(writes)
         return True
         
     def _load_party(self):
@@ -975,6 +1226,7 @@ class CombatTab(QtWidgets.QWidget):
     def _advance_combat_next(self):
         if not self.combatants: return
         self.round = max(1, self.round)
+        previous = self.turn_index
         if self.turn_index < 0:
             self.turn_index = 0
         elif self.turn_index == len(self.combatants) - 1:
@@ -983,12 +1235,13 @@ class CombatTab(QtWidgets.QWidget):
         else:
             self.turn_index += 1
             
-        self._refresh_combat_list()
+        self._refresh_combat_rows(previous, self.turn_index)
         self._persist_party()
 
     def _advance_combat_prev(self):
         if not self.combatants: return
         self.round = max(1, self.round)
+        previous = self.turn_index
         if self.turn_index < 0:
             return
         if self.turn_index == 0:
@@ -1000,7 +1253,7 @@ class CombatTab(QtWidgets.QWidget):
         else:
             self.turn_index -= 1
             
-        self._refresh_combat_list()
+        self._refresh_combat_rows(previous, self.turn_index)
         self._persist_party()
 
     def _load_session_roster(self):
@@ -1009,13 +1262,12 @@ class CombatTab(QtWidgets.QWidget):
             QtWidgets.QMessageBox.information(self, "No Session", "No saved session roster found.")
             return
         try:
-            import json
-            with open(SESSION_ROSTER_FP, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_loads(SESSION_ROSTER_FP.read_bytes())
             members = data.get("roster", data.get("entries", []))
             if not isinstance(members, list):
                 members = []
-            self.combatants = [deepcopy(member) for member in members if isinstance(member, dict)]
+            # Freshly parsed, so the members can be adopted without copying.
+            self.combatants = [member for member in members if isinstance(member, dict)]
             ensure_live_combat_instance_ids(self.combatants)
             self.turn_index = data.get("turn_index", -1)
             self.round = data.get("round", 1)
@@ -1039,12 +1291,14 @@ class CombatTab(QtWidgets.QWidget):
         self.parent._log(f"Saved session roster ({len(self.combatants)} members)")
             
     def _on_combat_selection_changed(self):
+        if self._refreshing_combat_list:
+            return
         self._sync_selected_strip()
 
     def _sync_selected_strip(self):
         if not hasattr(self, "lblSelectedCombatant"):
             return
-        rows = sorted({index.row() for index in self.listCombat.selectedIndexes()})
+        rows = sorted(self._selected_combat_rows())
         valid = [row for row in rows if 0 <= row < len(self.combatants)]
         single = len(valid) == 1
         if single:
@@ -1084,9 +1338,9 @@ class CombatTab(QtWidgets.QWidget):
 
     def _roll_initiative_all(self):
         # initTotal = d20 + initMod, keep initMod
-        for m in self.combatants:
+        rolls = roll_d20s(len(self.combatants))
+        for m, roll in zip(self.combatants, rolls):
             mod = int(m.get("initMod") or 0)
-            roll = roll_d20()
             m["initRoll"] = roll
             m["initTotal"] = roll + mod
         self.parent._log("Rolled initiative for all.")
@@ -1099,9 +1353,7 @@ class CombatTab(QtWidgets.QWidget):
             if 0 <= self.turn_index < len(self.combatants)
             else None
         )
-        self.combatants.sort(
-            key=lambda m: (m.get("initTotal") is None, -(m.get("initTotal") or 0), m.get("name","").lower())
-        )
+        self.combatants.sort(key=initiative_sort_key)
         self.turn_index = live_combatant_index(self.combatants, current_id)
         if current_id is None:
             self.turn_index = -1
@@ -1110,14 +1362,16 @@ class CombatTab(QtWidgets.QWidget):
         self.parent._log("Sorted by initiative.")
 
     def _adjust_hp_selected(self, delta: int):
-        rows = [i.row() for i in self.listCombat.selectedIndexes()]
+        rows = self._selected_combat_rows()
         if not rows: return
         changed = []
+        changed_rows = []
         for r in rows:
             changed_label = CombatTab._adjust_combatant_value(self, r, delta)
             if changed_label:
                 changed.append(changed_label)
-        self._refresh_combat_list()
+                changed_rows.append(r)
+        self._refresh_combat_rows(*changed_rows)
         self._persist_party()
         if changed:
             self.parent._log(f"Adjusted combat metric for: {', '.join(changed)} ({delta:+})")
@@ -1132,22 +1386,23 @@ class CombatTab(QtWidgets.QWidget):
         if maximum is None:
             maximum = current if current > 0 else 1
         maximum = max(1, coerce_metric_int(maximum, 1))
-        entity[metric.field] = max(0, min(current + delta, maximum))
+        value = current + delta
+        entity[metric.field] = 0 if value < 0 else maximum if value > maximum else value
         return f"{entity.get('name', '?')} {metric.label}"
 
     def _adjust_combatant(self, row: int, delta: int):
         changed = self._adjust_combatant_value(row, delta)
         if not changed:
             return
-        self._refresh_combat_list()
+        self._refresh_combat_rows(row)
         self._persist_party()
         self.parent._log(f"Adjusted combat metric for: {changed} ({delta:+})")
 
     def _set_selected_metric(self):
-        rows = self.listCombat.selectedIndexes()
+        rows = self._selected_combat_rows()
         if len(rows) != 1:
             return
-        row = rows[0].row()
+        row = rows[0]
         if not (0 <= row < len(self.combatants)):
             return
         entity = self.combatants[row]
@@ -1164,22 +1419,22 @@ class CombatTab(QtWidgets.QWidget):
         if not accepted:
             return
         entity[metric.field] = value
-        self._refresh_combat_list()
+        self._refresh_combat_rows(row)
         self._persist_party()
         self.parent._log(
             f"Set {entity.get('name', '?')} {metric.label} to {value}."
         )
 
     def _edit_statuses_selected(self):
-        rows = self.listCombat.selectedIndexes()
+        rows = self._selected_combat_rows()
         if not rows: return
-        idx = rows[0].row()
+        idx = rows[0]
         if not (0 <= idx < len(self.combatants)): return
         m = self.combatants[idx]
         cur = list(m.get("statuses") or [])
-        dlg = self.parent._StatusEditorDialog(self.parent, cur, self.parent._status_catalog)
+        dlg = self.parent._status_editor(cur)
         if dlg.exec():
             m["statuses"] = dlg.payload()
-            self._refresh_combat_list()
+            self._refresh_combat_rows(idx)
             self._persist_party()
             self.parent._log(f"Updated statuses: {m.get('name','?')}")
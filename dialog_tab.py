@@ -2,12 +2,12 @@ from __future__ import annotations
 from PySide6 import QtWidgets, QtCore, QtGui
 from typing import Dict, List, Any
 import json
-from copy import deepcopy
+import weakref
 from pathlib import Path
 from uuid import uuid4
 
 from app_paths import DIALOG_FP, DIALOGMETA, DIALOG_DIR, DIALOG_BLOCKS
-from helpers import atomic_write_text, load_json, write_json
+from helpers import atomic_write_bytes, clone_json, json_bytes, load_json, uuid4_strs
 from portrait_library import DialogBlockEditor, PORTRAIT_SOURCE_DIR_FIELD
 
 
@@ -22,6 +22,19 @@ class DialogListWidget(QtWidgets.QListWidget):
         ])
 
 
+class DialogRowDelegate(QtWidgets.QStyledItemDelegate):
+    """Bolds the live block's row at paint time from ``DialogTab.dialog_index``."""
+
+    def __init__(self, tab: "DialogTab"):
+        super().__init__(tab.listDialog)
+        self.tab = tab
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        if index.row() == self.tab.dialog_index:
+            option.font.setBold(True)
+
+
 def parse_dialog_blocks_document(data: Any) -> List[Dict[str, Any]]:
     if not isinstance(data, list):
         raise ValueError("dialog blocks document must be a JSON list")
@@ -34,16 +47,44 @@ def parse_dialog_blocks_document(data: Any) -> List[Dict[str, Any]]:
             continue
         normalized = dict(block)
         normalized.update({
-            "id": block.get("id") or str(uuid4()),
+            "id": block.get("id"),
             "text": text,
             "speaker": block.get("speaker", ""),
             "time": block.get("time", ""),
         })
         blocks.append(normalized)
+    assign_missing_block_ids(blocks)
     return blocks
+
+
+def assign_missing_block_ids(blocks: List[Dict[str, Any]]) -> None:
+    """Give blocks without an id a fresh one, drawing all IDs in one batch."""
+    missing = [block for block in blocks if not block.get("id")]
+    for block, block_id in zip(missing, uuid4_strs(len(missing))):
+        block["id"] = block_id
+
+
+# parent -> its reused confirmation box; PySide deletes an exec()'d dialog
+# once Python drops it, so the box must stay referenced here.
+_confirm_boxes: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def confirm(parent: QtWidgets.QWidget, title: str, text: str) -> bool:
+    """Yes/No question on one message box reused per parent; No is the default."""
+    box = _confirm_boxes.get(parent)
+    if box is None:
+        box = _confirm_boxes[parent] = QtWidgets.QMessageBox(parent)
+        box.setIcon(QtWidgets.QMessageBox.Question)
+        box.setStandardButtons(QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
+        box.setDefaultButton(QtWidgets.QMessageBox.No)
+    box.setWindowTitle(title)
+    box.setText(text)
+    return box.exec() == QtWidgets.QMessageBox.Yes
+
 
 class DialogTab(QtWidgets.QWidget):
     progressionChanged = QtCore.Signal()
+    dialogWriteFailed = QtCore.Signal(str)
 
     def __init__(self, parent: QtWidgets.QMainWindow):
         super().__init__()
@@ -55,6 +96,32 @@ class DialogTab(QtWidgets.QWidget):
         self._dialog_state_write_blocked = False
         self._dialog_write_warning_shown = False
         self._dialog_meta_document: Dict = {}
+        # path -> (bytes, mtime_ns) last written, so unchanged files are skipped
+        self._dialog_written: Dict[Path, tuple] = {}
+        # copy of the blocks as last written, to skip flushes that change nothing
+        self._dialog_flushed_blocks: List[Dict] | None = None
+        # Coalesce bursts of block edits into one write of the dialog files.
+        self._dialog_flush_timer = QtCore.QTimer(self)
+        self._dialog_flush_timer.setSingleShot(True)
+        self._dialog_flush_timer.setInterval(250)
+        self._dialog_flush_timer.timeout.connect(self._flush_dialog)
+        # Stepping through blocks coalesces into one write of the position file.
+        self._dialog_state_timer = QtCore.QTimer(self)
+        self._dialog_state_timer.setSingleShot(True)
+        self._dialog_state_timer.setInterval(250)
+        self._dialog_state_timer.timeout.connect(self._persist_dialog_state_now)
+        # The position file is written on one worker thread, in submission order.
+        self._state_write_pool = QtCore.QThreadPool(self)
+        self._state_write_pool.setMaxThreadCount(1)
+        self.dialogWriteFailed.connect(self.parent._toast)
+        # block text -> collapsed one-line preview shown under each list row
+        self._row_previews: Dict[str, str] = {}
+        self._pending_preview_row = -1
+        self._preview_text = ""
+        self._preview_timer = QtCore.QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(50)
+        self._preview_timer.timeout.connect(self._apply_dialog_preview)
         
         self._build_ui()
         self._wire_signals()
@@ -91,6 +158,7 @@ class DialogTab(QtWidgets.QWidget):
         self.listDialog = DialogListWidget()
         self.listDialog.setAlternatingRowColors(True)
         self.listDialog.setUniformItemSizes(False)
+        self.listDialog.setItemDelegate(DialogRowDelegate(self))
         self.listDialog.setDragDropMode(QtWidgets.QAbstractItemView.InternalMove)
         self.listDialog.setDefaultDropAction(QtCore.Qt.MoveAction)
         self.listDialog.setDropIndicatorShown(True)
@@ -137,11 +205,24 @@ class DialogTab(QtWidgets.QWidget):
         )
 
     def _on_dialog_row_changed(self, new_row: int):
-        if 0 <= new_row < len(self.dialog_blocks):
-            self.dialog_preview.setText(self.dialog_blocks[new_row].get("text", ""))
-        else:
-            self.dialog_preview.clear()
+        # Arrow-keying through the list only lays out the row it stops on.
+        self._pending_preview_row = new_row
+        self._preview_timer.start()
         self._sync_action_states()
+
+    def _apply_dialog_preview(self):
+        row = self._pending_preview_row
+        text = (
+            self.dialog_blocks[row].get("text", "")
+            if 0 <= row < len(self.dialog_blocks)
+            else ""
+        )
+        if text != self._preview_text:
+            self._preview_text = text
+            if text:
+                self.dialog_preview.setText(text)
+            else:
+                self.dialog_preview.clear()
 
     def _update_dialog_hud(self):
         idx = self.dialog_index
@@ -190,11 +271,12 @@ class DialogTab(QtWidgets.QWidget):
                             continue
                         info = meta.get(t, {}) if isinstance(meta, dict) else {}
                         blocks.append({
-                            "id": info.get("id") or str(uuid4()),
+                            "id": info.get("id"),
                             "text": t,
                             "speaker": info.get("speaker", ""),
                             "time": info.get("time", ""),
                         })
+                    assign_missing_block_ids(blocks)
             except FileNotFoundError:
                 blocks = []
             except (OSError, UnicodeError) as e:
@@ -219,39 +301,74 @@ class DialogTab(QtWidgets.QWidget):
         self._update_dialog_hud()
         self.parent._log("Dialog loaded from file.")
         
+    def _dialog_row_label(self, i: int, block: Dict) -> str:
+        speaker = str(block.get("speaker") or "Narrator")
+        text = str(block.get("text") or "")
+        preview = self._row_previews.get(text)
+        if preview is None:
+            preview = " ".join(text.split())
+            if len(preview) > 90:
+                preview = preview[:87] + "…"
+            self._row_previews[text] = preview
+        offset = i - self.dialog_index  # a row is at most one of LIVE / NEXT
+        marker = "[LIVE] " if offset == 0 else "[NEXT] " if offset == 1 else ""
+        portrait = " ◉" if block.get("portrait") or block.get("portrait_id") else ""
+        return f"{marker}{i + 1}  {speaker}{portrait}\n{preview}"
+
+    def _apply_dialog_item(self, item: QtWidgets.QListWidgetItem, i: int, block: Dict):
+        """Bring one list item in line with its block, touching only what changed."""
+        label = self._dialog_row_label(i, block)
+        if item.text() != label:
+            item.setText(label)
+        block_id = block.get("id")
+        if item.data(QtCore.Qt.UserRole) != block_id:
+            item.setData(QtCore.Qt.UserRole, block_id)
+
+    def _update_dialog_row(self, row: int):
+        item = self.listDialog.item(row)
+        if item is not None and 0 <= row < len(self.dialog_blocks):
+            self._apply_dialog_item(item, row, self.dialog_blocks[row])
+
     def _refresh_dialog_list(self, selected_id: str | None = None):
         if selected_id is None:
             selected = self.listDialog.currentItem()
             selected_id = (
                 selected.data(QtCore.Qt.UserRole) if selected is not None else None
             )
-        self.listDialog.clear()
-        for i, block in enumerate(self.dialog_blocks):
-            speaker = str(block.get("speaker") or "Narrator")
-            preview = " ".join(str(block.get("text") or "").split())
-            if len(preview) > 90:
-                preview = preview[:87] + "…"
-            markers = []
-            if i == self.dialog_index:
-                markers.append("LIVE")
-            if i == self.dialog_index + 1:
-                markers.append("NEXT")
-            marker = f"[{' / '.join(markers)}] " if markers else ""
-            portrait = " ◉" if block.get("portrait") or block.get("portrait_id") else ""
-            item = QtWidgets.QListWidgetItem(
-                f"{marker}{i + 1}  {speaker}{portrait}\n{preview}"
-            )
-            item.setData(QtCore.Qt.UserRole, block.get("id"))
-            item.setSizeHint(QtCore.QSize(0, self.listDialog.fontMetrics().lineSpacing() * 2 + 10))
-            if i == self.dialog_index:
-                font = item.font()
-                font.setBold(True)
-                item.setFont(font)
-            self.listDialog.addItem(item)
-            if block.get("id") == selected_id:
-                self.listDialog.setCurrentItem(item)
+        # Reuse existing items in place; only the tail is added or removed.
+        lst = self.listDialog
+        lst.setUpdatesEnabled(False)
+        signals_blocked = lst.blockSignals(True)
+        try:
+            while lst.count() > len(self.dialog_blocks):
+                lst.takeItem(lst.count() - 1)
+            row_height = lst.fontMetrics().lineSpacing() * 2 + 10
+            target_row = -1
+            for i, block in enumerate(self.dialog_blocks):
+                item = lst.item(i)
+                if item is None:
+                    item = QtWidgets.QListWidgetItem()
+                    item.setSizeHint(QtCore.QSize(0, row_height))
+                    lst.addItem(item)
+                self._apply_dialog_item(item, i, block)
+                if target_row < 0 and selected_id is not None and block.get("id") == selected_id:
+                    target_row = i
+            if target_row >= 0:
+                lst.setCurrentRow(target_row)
+            else:
+                lst.setCurrentRow(-1)
+                lst.clearSelection()
+        finally:
+            lst.blockSignals(signals_blocked)
+            lst.setUpdatesEnabled(True)
+        if len(self._row_previews) > 2 * len(self.dialog_blocks) + 16:
+            live = {str(block.get("text") or "") for block in self.dialog_blocks}
+            self._row_previews = {
+                text: preview for text, preview in self._row_previews.items() if text in live
+            }
+        # Row changes were silenced above; sync preview and actions once.
+        self._on_dialog_row_changed(lst.currentRow())
         self._update_dialog_hud()
-        self._sync_action_states()
 
     def _sync_action_states(self):
         row = self.listDialog.currentRow()
@@ -289,22 +406,60 @@ class DialogTab(QtWidgets.QWidget):
             self.searchDialog.clear()
 
     def _persist_dialog(self):
-        current_blocks = load_json(DIALOG_BLOCKS)
-        if current_blocks.valid:
-            try:
-                parse_dialog_blocks_document(current_blocks.data)
-            except ValueError:
+        """Schedule a write of the dialog files; False if writes are blocked."""
+        # Ensure every block has a stable ID before callers look them up.
+        assign_missing_block_ids(self.dialog_blocks)
+        if not self._dialog_sources_writable():
+            return False
+        self._dialog_flush_timer.start()
+        return True
+
+    def _flush_persist_dialog(self):
+        if self._dialog_flush_timer.isActive():
+            self._flush_dialog()
+        if self._dialog_state_timer.isActive():
+            self._persist_dialog_state_now()
+        self._state_write_pool.waitForDone()
+
+    def _dialog_file_unchanged(self, path: Path) -> bool:
+        """True when path is still exactly the file this tab last wrote."""
+        last = self._dialog_written.get(path)
+        if last is None:
+            return False
+        try:
+            return path.stat().st_mtime_ns == last[1]
+        except OSError:
+            return False
+
+    def _write_dialog_file(self, path: Path, data: bytes):
+        """Write path unless it still holds exactly the bytes written last time."""
+        last = self._dialog_written.get(path)
+        if last is not None and last[0] == data and self._dialog_file_unchanged(path):
+            return
+        atomic_write_bytes(path, data)
+        self._dialog_written[path] = (data, path.stat().st_mtime_ns)
+
+    def _dialog_sources_writable(self) -> bool:
+        """Check the dialog files on disk; False (with a one-time toast) if writes are blocked."""
+        # Files still exactly as this tab wrote them need no re-read or re-check.
+        if not self._dialog_file_unchanged(DIALOG_BLOCKS):
+            current_blocks = load_json(DIALOG_BLOCKS)
+            if current_blocks.valid:
+                try:
+                    parse_dialog_blocks_document(current_blocks.data)
+                except ValueError:
+                    self._dialog_write_blocked = True
+            elif not current_blocks.missing:
                 self._dialog_write_blocked = True
-        elif not current_blocks.missing:
-            self._dialog_write_blocked = True
-        current_meta = load_json(DIALOGMETA)
-        if current_meta.valid:
-            if isinstance(current_meta.data, dict):
-                self._dialog_meta_document = dict(current_meta.data)
-            else:
+        if not self._dialog_file_unchanged(DIALOGMETA):
+            current_meta = load_json(DIALOGMETA)
+            if current_meta.valid:
+                if isinstance(current_meta.data, dict):
+                    self._dialog_meta_document = dict(current_meta.data)
+                else:
+                    self._dialog_write_blocked = True
+            elif not current_meta.valid and not current_meta.missing:
                 self._dialog_write_blocked = True
-        elif not current_meta.valid and not current_meta.missing:
-            self._dialog_write_blocked = True
         if self._dialog_write_blocked:
             if not self._dialog_write_warning_shown:
                 self.parent._toast(
@@ -312,35 +467,75 @@ class DialogTab(QtWidgets.QWidget):
                 )
                 self._dialog_write_warning_shown = True
             return False
-        # Ensure every block has a stable ID
-        for b in self.dialog_blocks:
-            if not b.get("id"):
-                b["id"] = str(uuid4())
+        return True
 
-        # Plain text file consumed by overlay
-        text_content = "\n---\n".join([b["text"] for b in self.dialog_blocks])
-        atomic_write_text(DIALOG_FP, text_content, encoding="utf-8")
+    def _flush_dialog(self):
+        self._dialog_flush_timer.stop()
+        if not self._dialog_sources_writable():
+            return False
+        if self.dialog_blocks == self._dialog_flushed_blocks and all(
+            self._dialog_file_unchanged(path) for path in (DIALOG_FP, DIALOGMETA, DIALOG_BLOCKS)
+        ):
+            return True
+        try:
+            # Plain text file consumed by overlay
+            text_content = b"\n---\n".join(
+                b["text"].encode("utf-8") for b in self.dialog_blocks
+            )
+            self._write_dialog_file(DIALOG_FP, text_content)
         
-        # Legacy meta (for backwards compatibility, keyed by text)
-        meta = dict(self._dialog_meta_document)
-        for b in self.dialog_blocks:
-            entry = dict(meta.get(b["text"], {})) if isinstance(meta.get(b["text"]), dict) else {}
-            entry.update({
-                "id": b.get("id"),
-                "speaker": b.get("speaker"),
-                "time": b.get("time"),
-            })
-            meta[b["text"]] = entry
-        write_json(DIALOGMETA, meta)
-        self._dialog_meta_document = dict(meta)
-
-        # Rich blocks file with stable IDs
-        write_json(DIALOG_BLOCKS, [dict(b) for b in self.dialog_blocks])
+            # Legacy meta (for backwards compatibility, keyed by text). Only entries
+            # whose id/speaker/time moved are replaced, and the whole document is
+            # re-encoded only when one did or the file changed on disk.
+            meta = dict(self._dialog_meta_document)
+            meta_changed = False
+            for b in self.dialog_blocks:
+                fields = {
+                    "id": b.get("id"),
+                    "speaker": b.get("speaker"),
+                    "time": b.get("time"),
+                }
+                existing = meta.get(b["text"])
+                if isinstance(existing, dict):
+                    if all(existing.get(key) == value for key, value in fields.items()):
+                        continue
+                    entry = dict(existing)
+                else:
+                    entry = {}
+                entry.update(fields)
+                meta[b["text"]] = entry
+                meta_changed = True
+            if meta_changed or not self._dialog_file_unchanged(DIALOGMETA):
+                self._write_dialog_file(DIALOGMETA, json_bytes(meta, compact=True))
+            self._dialog_meta_document = meta
+
+            # Rich blocks file with stable IDs
+            self._write_dialog_file(
+                DIALOG_BLOCKS, json_bytes([dict(b) for b in self.dialog_blocks], compact=True)
+            )
+        except OSError as e:
+            # Runs from the flush timer, so nothing above would report it.
+            self.parent._toast(f"Could not save dialog files: {e}")
+            return False
+        self._dialog_flushed_blocks = clone_json(self.dialog_blocks)
         return True
+
+    def _refresh_live_rows(self, previous: int):
+        """Relabel only the rows whose LIVE/NEXT marker moved off or onto them.
+
+        Stepping the live block changes no row but these; the list itself,
+        selection and preview stay as they are."""
+        if self.listDialog.count() != len(self.dialog_blocks):
+            self._refresh_dialog_list()
+            return
+        for row in {previous, previous + 1, self.dialog_index, self.dialog_index + 1}:
+            self._update_dialog_row(row)
+        self._update_dialog_hud()
 
     def _dialog_next_local(self):
         if not self.dialog_blocks:
             return
+        previous = self.dialog_index
         if self.dialog_index < 0:
             self.dialog_index = 0
         elif self.dialog_index < len(self.dialog_blocks) - 1:
@@ -349,28 +544,37 @@ class DialogTab(QtWidgets.QWidget):
             self.parent._toast("End of dialog sequence.")
             return
         self._persist_dialog_state()
-        self._refresh_dialog_list()
+        self._refresh_live_rows(previous)
         self.listDialog.scrollToItem(self.listDialog.item(self.dialog_index))
 
     def _dialog_prev_local(self):
         if not self.dialog_blocks:
             return
+        previous = self.dialog_index
         if self.dialog_index > 0:
             self.dialog_index -= 1
         else:
             self.parent._toast("Start of dialog sequence.")
             return
         self._persist_dialog_state()
-        self._refresh_dialog_list()
+        self._refresh_live_rows(previous)
         self.listDialog.scrollToItem(self.listDialog.item(self.dialog_index))
 
     def _persist_dialog_state(self):
-        # A simple state persistence for the overlay to read
+        """Schedule a write of the dialog position; False if writes are blocked."""
         if self._dialog_state_write_blocked:
             self.parent._toast(
                 f"Dialog position not saved because {DIALOG_FP.with_suffix('.json').name} is invalid."
             )
             return False
+        self._dialog_state_timer.start()
+        return True
+
+    def _persist_dialog_state_now(self):
+        # A simple state persistence for the overlay to read
+        self._dialog_state_timer.stop()
+        if self._dialog_state_write_blocked:
+            return False
         result = load_json(DIALOG_FP.with_suffix(".json"))
         if result.valid and isinstance(result.data, dict):
             state = dict(result.data)
@@ -383,16 +587,24 @@ class DialogTab(QtWidgets.QWidget):
             )
             return False
         state["index"] = self.dialog_index
-        write_json(DIALOG_FP.with_suffix(".json"), state)
+        path = DIALOG_FP.with_suffix(".json")
+        data = json_bytes(state)
+
+        def run():
+            try:
+                atomic_write_bytes(path, data)
+            except OSError as e:
+                self.dialogWriteFailed.emit(f"Could not save {path.name}: {e}")
+
+        self._state_write_pool.start(run)
         return True
 
     def _dialog_make_current(self):
         row = self.listDialog.currentRow()
         if 0 <= row < len(self.dialog_blocks):
-            self.dialog_index = row
+            previous, self.dialog_index = self.dialog_index, row
             self._persist_dialog_state()
-            selected_id = self.dialog_blocks[row].get("id")
-            self._refresh_dialog_list(selected_id)
+            self._refresh_live_rows(previous)
             self.parent._log(f"Dialog current index set to {row+1}.")
 
     def _move_dialog_block(self, delta: int):
@@ -498,22 +710,24 @@ class DialogTab(QtWidgets.QWidget):
                 return
             self.dialog_blocks[row] = payload
             self._persist_dialog()
-            self._refresh_dialog_list(payload.get("id"))
+            self._update_dialog_row(row)
+            self.listDialog.setCurrentRow(row)
+            self._on_dialog_row_changed(row)
+            self._update_dialog_hud()
             self.parent._log(f"Edited dialog block {row+1}.")
 
     def _portrait_entities(self) -> List[Dict]:
         """Return live and already-loaded roster entities without mutating sources."""
         entities: List[Dict] = []
         combat_tab = getattr(self.parent, "combat_tab", None)
-        entities.extend(deepcopy(getattr(combat_tab, "combatants", []) or []))
+        entities.extend(clone_json(getattr(combat_tab, "combatants", []) or []))
         rosters_tab = getattr(self.parent, "rosters_tab", None)
         for pack in getattr(rosters_tab, "_packs", []) or []:
-            source = pack.get("file")
-            source_dir = str(Path(source).resolve().parent) if source else None
+            source_dir = pack.get("source_dir")
             for raw in pack.get("entries", []) or []:
                 if not isinstance(raw, dict):
                     continue
-                entity = deepcopy(raw)
+                entity = clone_json(raw)
                 if source_dir:
                     entity.setdefault(PORTRAIT_SOURCE_DIR_FIELD, source_dir)
                 entities.append(entity)
@@ -523,12 +737,7 @@ class DialogTab(QtWidgets.QWidget):
         """Delete a dialog block."""
         if not (0 <= row < len(self.dialog_blocks)):
             return
-        reply = QtWidgets.QMessageBox.question(
-            self, "Delete Dialog Block",
-            f"Delete dialog block {row+1}?",
-            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
-        )
-        if reply == QtWidgets.QMessageBox.Yes:
+        if confirm(self, "Delete Dialog Block", f"Delete dialog block {row+1}?"):
             removed = self.dialog_blocks[row]
             live_id = (
                 self.dialog_blocks[self.dialog_index].get("id")
@@ -556,7 +765,7 @@ class DialogTab(QtWidgets.QWidget):
         if not (0 <= row < len(self.dialog_blocks)):
             return
         original = self.dialog_blocks[row]
-        new_block = deepcopy(original)
+        new_block = clone_json(original)
         new_block["id"] = str(uuid4())
         self.dialog_blocks.insert(row + 1, new_block)
         self._persist_dialog()
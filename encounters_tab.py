@@ -1,14 +1,17 @@
 from __future__ import annotations
+import os
 from PySide6 import QtWidgets, QtCore, QtGui
-from copy import deepcopy
+from pathlib import Path
 
 from app_paths import DATA_ROOT, COMBAT_DIR, DIALOG_DIR
-from helpers import load_json, write_json
+from helpers import load_json, write_json, list_json_stems
 from portrait_library import PORTRAIT_SOURCE_DIR_FIELD
 from combat_tab import ensure_live_combat_instance_ids
+from dialog_tab import confirm
 
 
 def parse_combat_encounter(data):
+    """Validate a freshly loaded combat save; its party list is returned as-is."""
     if not isinstance(data, dict) or "party" not in data:
         raise ValueError("unsupported combat encounter format (expected a 'party' list)")
     party = data.get("party")
@@ -20,10 +23,11 @@ def parse_combat_encounter(data):
         raise ValueError("'turn_index' must be an integer")
     if not isinstance(round_number, int) or isinstance(round_number, bool):
         raise ValueError("'round' must be an integer")
-    return [deepcopy(member) for member in party], turn_index, round_number
+    return party, turn_index, round_number
 
 
 def parse_dialog_encounter(data):
+    """Validate a freshly loaded dialog save; its block list is returned as-is."""
     if not isinstance(data, dict) or "dialog" not in data:
         raise ValueError("unsupported dialog encounter format (expected a 'dialog' list)")
     blocks = data.get("dialog")
@@ -32,12 +36,23 @@ def parse_dialog_encounter(data):
     dialog_index = data.get("dialog_index", -1)
     if not isinstance(dialog_index, int) or isinstance(dialog_index, bool):
         raise ValueError("'dialog_index' must be an integer")
-    return [deepcopy(block) for block in blocks], dialog_index
+    return blocks, dialog_index
+
+
+_ENCOUNTER_KINDS = {"Combat": ("[Combat]", COMBAT_DIR), "Dialog": ("[Dialog]", DIALOG_DIR)}
+
+
+def _encounter_item(kind: str, stem: str, fp: Path) -> QtWidgets.QListWidgetItem:
+    item = QtWidgets.QListWidgetItem(f"{_ENCOUNTER_KINDS[kind][0]} {stem}")
+    item.setData(QtCore.Qt.UserRole, (kind, stem, fp))
+    return item
+
 
 class EncountersTab(QtWidgets.QWidget):
     def __init__(self, parent: QtWidgets.QMainWindow):
         super().__init__()
         self.parent = parent
+        self._listing_cache: dict[Path, tuple[int, list[str]]] = {}  # dir -> (mtime_ns, stems)
         self._build_ui()
         self._load_encounter_list()
 
@@ -67,17 +82,44 @@ class EncountersTab(QtWidgets.QWidget):
         self.btnDelete.clicked.connect(self._delete_encounter)
         self.listEncounters.itemDoubleClicked.connect(self._load_encounter)
 
+    def _encounter_stems(self, directory: Path) -> list[str]:
+        """Sorted encounter names in directory, re-globbed only when it changes."""
+        try:
+            mtime = directory.stat().st_mtime_ns
+        except OSError:
+            return []
+        cached = self._listing_cache.get(directory)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, list_json_stems(directory))
+            self._listing_cache[directory] = cached
+        return cached[1]
+
     def _load_encounter_list(self):
-        self.listEncounters.clear()
-        
-        encounters = []
-        for fp in sorted(COMBAT_DIR.glob("*.json")):
-            encounters.append(f"[Combat] {fp.stem}")
-            
-        for fp in sorted(DIALOG_DIR.glob("*.json")):
-            encounters.append(f"[Dialog] {fp.stem}")
-            
-        self.listEncounters.addItems(encounters)
+        lst = self.listEncounters
+        lst.setUpdatesEnabled(False)
+        try:
+            lst.clear()
+            for kind, (label, directory) in _ENCOUNTER_KINDS.items():
+                for stem in self._encounter_stems(directory):
+                    lst.addItem(_encounter_item(kind, stem, directory / f"{stem}.json"))
+        finally:
+            lst.setUpdatesEnabled(True)
+
+    def _add_encounter_item(self, kind: str, stem: str, fp: Path):
+        """Insert a just-saved encounter where a full reload would have put it."""
+        order = list(_ENCOUNTER_KINDS)
+        key = (order.index(kind), os.path.normcase(stem))
+        lst = self.listEncounters
+        row = lst.count()
+        for i in range(lst.count()):
+            item_kind, item_stem, _ = lst.item(i).data(QtCore.Qt.UserRole)
+            item_key = (order.index(item_kind), os.path.normcase(item_stem))
+            if item_key == key:
+                return  # overwrote an existing save
+            if item_key > key:
+                row = i
+                break
+        lst.insertItem(row, _encounter_item(kind, stem, fp))
 
     def _save_combat(self):
         name, ok = QtWidgets.QInputDialog.getText(self, "Save Encounter", "Enter name for combat encounter:")
@@ -91,8 +133,9 @@ class EncountersTab(QtWidgets.QWidget):
         
         fp = COMBAT_DIR / f"{name.strip()}.json"
         write_json(fp, payload)
+        self._listing_cache.pop(COMBAT_DIR, None)
         self.parent._log(f"Saved combat encounter: {fp.name}")
-        self._load_encounter_list()
+        self._add_encounter_item("Combat", fp.stem, fp)
         
     def _save_dialog(self):
         name, ok = QtWidgets.QInputDialog.getText(self, "Save Encounter", "Enter name for dialog encounter:")
@@ -105,95 +148,87 @@ class EncountersTab(QtWidgets.QWidget):
         
         fp = DIALOG_DIR / f"{name.strip()}.json"
         write_json(fp, payload)
+        self._listing_cache.pop(DIALOG_DIR, None)
         self.parent._log(f"Saved dialog encounter: {fp.name}")
-        self._load_encounter_list()
+        self._add_encounter_item("Dialog", fp.stem, fp)
 
     def _load_encounter(self):
         selected = self.listEncounters.currentItem()
         if not selected: return
         
-        name = selected.text()
-        parts = name.split(" ")
-        enc_type = parts[0][1:-1]
-        enc_name = " ".join(parts[1:])
+        enc_type, enc_name, fp = selected.data(QtCore.Qt.UserRole)
         
         if enc_type == "Combat":
-            fp = COMBAT_DIR / f"{enc_name}.json"
-            if fp.exists():
-                result = load_json(fp)
-                if not result.valid:
-                    QtWidgets.QMessageBox.warning(
-                        self, "Encounter Not Loaded",
-                        f"{fp.name} is not valid JSON and the current combat was left unchanged."
-                    )
-                    return
-                try:
-                    party, turn_index, round_number = parse_combat_encounter(result.data)
-                except ValueError as e:
-                    QtWidgets.QMessageBox.warning(
-                        self, "Encounter Not Loaded",
-                        f"{e}\n\nThe current combat was left unchanged."
-                    )
-                    return
-                source_dir = str(fp.resolve().parent)
-                for member in party:
-                    member.setdefault(PORTRAIT_SOURCE_DIR_FIELD, source_dir)
-                ensure_live_combat_instance_ids(party)
-                self.parent.combat_tab.combatants = party
-                self.parent.combat_tab.turn_index = turn_index
-                self.parent.combat_tab.round = round_number
-                self.parent.combat_tab._refresh_combat_list()
-                self.parent._log(f"Loaded combat encounter: {enc_name}")
+            result = load_json(fp)
+            if result.missing:
+                return
+            if not result.valid:
+                QtWidgets.QMessageBox.warning(
+                    self, "Encounter Not Loaded",
+                    f"{fp.name} is not valid JSON and the current combat was left unchanged."
+                )
+                return
+            try:
+                party, turn_index, round_number = parse_combat_encounter(result.data)
+            except ValueError as e:
+                QtWidgets.QMessageBox.warning(
+                    self, "Encounter Not Loaded",
+                    f"{e}\n\nThe current combat was left unchanged."
+                )
+                return
+            source_dir = str(fp.resolve().parent)
+            for member in party:
+                member.setdefault(PORTRAIT_SOURCE_DIR_FIELD, source_dir)
+            ensure_live_combat_instance_ids(party)
+            self.parent.combat_tab.combatants = party
+            self.parent.combat_tab.turn_index = turn_index
+            self.parent.combat_tab.round = round_number
+            self.parent.combat_tab._refresh_combat_list()
+            self.parent._log(f"Loaded combat encounter: {enc_name}")
         elif enc_type == "Dialog":
-            fp = DIALOG_DIR / f"{enc_name}.json"
-            if fp.exists():
-                result = load_json(fp)
-                if not result.valid:
-                    QtWidgets.QMessageBox.warning(
-                        self, "Encounter Not Loaded",
-                        f"{fp.name} is not valid JSON and the current dialog was left unchanged."
-                    )
-                    return
-                try:
-                    blocks, dialog_index = parse_dialog_encounter(result.data)
-                except ValueError as e:
-                    QtWidgets.QMessageBox.warning(
-                        self, "Encounter Not Loaded",
-                        f"{e}\n\nThe current dialog was left unchanged."
-                    )
-                    return
-                source_dir = str(fp.resolve().parent)
-                for block in blocks:
-                    block.setdefault(PORTRAIT_SOURCE_DIR_FIELD, source_dir)
-                self.parent.dialog_tab.dialog_blocks = blocks
-                self.parent.dialog_tab.dialog_index = dialog_index
-                self.parent.dialog_tab._refresh_dialog_list()
-                self.parent._log(f"Loaded dialog encounter: {enc_name}")
+            result = load_json(fp)
+            if result.missing:
+                return
+            if not result.valid:
+                QtWidgets.QMessageBox.warning(
+                    self, "Encounter Not Loaded",
+                    f"{fp.name} is not valid JSON and the current dialog was left unchanged."
+                )
+                return
+            try:
+                blocks, dialog_index = parse_dialog_encounter(result.data)
+            except ValueError as e:
+                QtWidgets.QMessageBox.warning(
+                    self, "Encounter Not Loaded",
+                    f"{e}\n\nThe current dialog was left unchanged."
+                )
+                return
+            source_dir = str(fp.resolve().parent)
+            for block in blocks:
+                block.setdefault(PORTRAIT_SOURCE_DIR_FIELD, source_dir)
+            self.parent.dialog_tab.dialog_blocks = blocks
+            self.parent.dialog_tab.dialog_index = dialog_index
+            self.parent.dialog_tab._refresh_dialog_list()
+            self.parent._log(f"Loaded dialog encounter: {enc_name}")
 
     def _delete_encounter(self):
         selected = self.listEncounters.currentItem()
         if not selected: return
 
-        name = selected.text()
-        parts = name.split(" ")
-        enc_type = parts[0][1:-1]
-        enc_name = " ".join(parts[1:])
+        enc_type, enc_name, fp = selected.data(QtCore.Qt.UserRole)
         
-        reply = QtWidgets.QMessageBox.question(self, 'Delete Encounter', 
-                                                f"Are you sure you want to delete '{enc_name}'?",
-                                                QtWidgets.QMessageBox.Yes, QtWidgets.QMessageBox.No)
-        if reply == QtWidgets.QMessageBox.No:
+        if not confirm(self, "Delete Encounter", f"Are you sure you want to delete '{enc_name}'?"):
             return
 
         if enc_type == "Combat":
-            fp = COMBAT_DIR / f"{enc_name}.json"
             if fp.exists():
                 fp.unlink()
+                self._listing_cache.pop(COMBAT_DIR, None)
                 self.parent._log(f"Deleted combat encounter: {enc_name}")
         elif enc_type == "Dialog":
-            fp = DIALOG_DIR / f"{enc_name}.json"
             if fp.exists():
                 fp.unlink()
+                self._listing_cache.pop(DIALOG_DIR, None)
                 self.parent._log(f"Deleted dialog encounter: {enc_name}")
         
-        self._load_encounter_list()
+        self.listEncounters.takeItem(self.listEncounters.row(selected))
@@ -1,5 +1,4 @@
 from __future__ import annotations
-import json
 import os
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
@@ -10,12 +9,12 @@ from PySide6 import QtWidgets, QtGui, QtCore
 from app_paths import (
     APP_DIR, PARTY_FP, CONFIG_FP, THEMES_DIR, DATA_ROOT,
     VAULT_DIR, DIALOG_FP, DIALOG_DIR, DIALOGMETA,
-    LOG_FILE, ROSTERS_DIR, BACKUPS_DIR,
+    LOG_FILE, ROSTERS_DIR, BACKUPS_DIR, STATUS_DIR,
 )
 from helpers import (
-    safe_json, load_json, write_json, now_iso, slug, config_bool, config_choice,
+    safe_json, json_loads, load_json, write_json, now_iso, slug, config_bool, config_choice,
     parse_rank, rank_label_for_pack, roll_d20,
-    load_status_catalog, collect_suffixes, next_suffix,
+    load_status_catalog, clone_json, JsonLoadResult,
     export_backup, restore_backup,
 )
 from styles import DARK_QSS, LIGHT_QSS, MD_CSS
@@ -36,7 +35,6 @@ from combat_metrics import (
     resolve_secondary_combat_metric,
     secondary_metric_warning,
 )
-from tracker_overlay import Overlay, overlay_runtime_log
 
 OVERLAY_THEME_LABELS = {
     "gm_modern": "GM Modern",
@@ -55,6 +53,12 @@ class GMWindow(QtWidgets.QMainWindow):
         super().__init__()
         self.setWindowTitle("EncounterOS — GM")
         self.resize(1220, 840)
+        # Log lines are appended to LOG_FILE in batches rather than one open/write per line.
+        self._log_buffer: List[str] = []
+        self._log_flush_timer = QtCore.QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(250)
+        self._log_flush_timer.timeout.connect(self._flush_log)
 
         cfg_result = load_json(CONFIG_FP)
         self._config_write_blocked = False
@@ -66,6 +70,16 @@ class GMWindow(QtWidgets.QMainWindow):
             cfg0 = {}
             self._config_write_blocked = True
         self._config_document = dict(cfg0)
+        # (mtime_ns, copy) of config.json as last read or written here, so saves
+        # only re-read the file after something else has changed it.
+        self._config_cache: tuple[int, dict] | None = None
+        if cfg_result.valid and isinstance(cfg_result.data, dict):
+            self._remember_config(cfg0)
+        # Coalesce bursts of settings changes (theme, poll interval, overlay fit) into one write.
+        self._config_persist_timer = QtCore.QTimer(self)
+        self._config_persist_timer.setSingleShot(True)
+        self._config_persist_timer.setInterval(250)
+        self._config_persist_timer.timeout.connect(self._persist_config_now)
         self.theme_name   = cfg0.get("theme", "gm_modern")
         self.auto_refresh = bool(cfg0.get("auto_refresh", True))
         try:
@@ -73,6 +87,9 @@ class GMWindow(QtWidgets.QMainWindow):
         except (TypeError, ValueError):
             self.poll_ms = 200
         self.ui_dark      = bool(cfg0.get("ui_dark", True))
+        self._applied_qss: str | None = None
+        self._themes_cache: tuple | None = None  # (folder mtimes, theme names)
+        self._themes_menu_names: List[str] | None = None
         self.show_secondary_combat_metrics = config_bool(
             cfg0.get("show_secondary_combat_metrics"),
             False,
@@ -91,10 +108,12 @@ class GMWindow(QtWidgets.QMainWindow):
         self.mode = str(cfg0.get("mode", "combat") or "combat")
         self.overlay_on = False
         self.overlay_win: Optional[QtWidgets.QWidget] = None
-        self._OverlayClass = Overlay
+        self._OverlayClass = None  # tracker_overlay is imported the first time the overlay is shown
         self._shortcuts = get_shortcuts_from_config(cfg0)
 
-        self._status_catalog = load_status_catalog()
+        self._status_catalog: list[str] = []
+        self._status_catalog_mtime: int | None = -1  # -1: not scanned yet
+        self._status_dialog: Optional["StatusEditorDialog"] = None
 
         # Build UI from new modules
         self._build_menubar()
@@ -126,8 +145,28 @@ class GMWindow(QtWidgets.QMainWindow):
         if self._config_write_blocked:
             self._toast(f"Configuration was not loaded; {CONFIG_FP.name} will not be overwritten.")
         
-        # allow tabs to create the dialog without import cycles
-        self._StatusEditorDialog = StatusEditorDialog
+        # allow tabs to create the dialogs without import cycles
+        self._EntityDialog = EntityDialog
+
+    def _current_status_catalog(self) -> list[str]:
+        """Status names from STATUS_DIR, rescanned only when the folder changes."""
+        try:
+            mtime = STATUS_DIR.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime != self._status_catalog_mtime:
+            self._status_catalog = load_status_catalog()
+            self._status_catalog_mtime = mtime
+        return self._status_catalog
+
+    def _status_editor(self, current_statuses: list[str]) -> "StatusEditorDialog":
+        """One status dialog for the session; reopening only resets its check marks."""
+        catalog = self._current_status_catalog()
+        if self._status_dialog is None:
+            self._status_dialog = StatusEditorDialog(self, current_statuses, catalog)
+        else:
+            self._status_dialog.set_statuses(current_statuses, catalog)
+        return self._status_dialog
 
     def _persist_all(self):
         self.combat_tab._persist_party()
@@ -276,8 +315,25 @@ class GMWindow(QtWidgets.QMainWindow):
         if not state_ok:
             self._apply_default_dock_layout()
 
+    def _load_config(self) -> JsonLoadResult:
+        """config.json, re-read only when it is no longer what this window last saw."""
+        cached = self._config_cache
+        if cached is not None:
+            try:
+                if CONFIG_FP.stat().st_mtime_ns == cached[0]:
+                    return JsonLoadResult(CONFIG_FP, "valid", data=cached[1])
+            except OSError:
+                pass
+        return load_json(CONFIG_FP)
+
+    def _remember_config(self, cfg: dict):
+        try:
+            self._config_cache = (CONFIG_FP.stat().st_mtime_ns, clone_json(cfg))
+        except OSError:
+            self._config_cache = None
+
     def _save_window_layout(self):
-        cfg_result = load_json(CONFIG_FP)
+        cfg_result = self._load_config()
         if self._config_write_blocked or (
             cfg_result.valid and not isinstance(cfg_result.data, dict)
         ) or (not cfg_result.valid and not cfg_result.missing):
@@ -288,7 +344,9 @@ class GMWindow(QtWidgets.QMainWindow):
             "geometry": encode_bytes(self.saveGeometry()),
             "state": encode_bytes(self.saveState(WINDOW_STATE_VERSION)),
         }
-        write_json(CONFIG_FP, cfg)
+        if not (cfg_result.valid and cfg == cfg_result.data):
+            write_json(CONFIG_FP, cfg)
+        self._remember_config(cfg)
         self._config_document = dict(cfg)
         return True
 
@@ -544,7 +602,16 @@ class GMWindow(QtWidgets.QMainWindow):
             self.dialog_tab._dialog_make_current()
 
     def _persist_config(self):
-        cfg_result = load_json(CONFIG_FP)
+        """Schedule a config write; restarting the timer coalesces rapid changes."""
+        self._config_persist_timer.start()
+
+    def _flush_persist_config(self):
+        if self._config_persist_timer.isActive():
+            self._persist_config_now()
+
+    def _persist_config_now(self):
+        self._config_persist_timer.stop()
+        cfg_result = self._load_config()
         if self._config_write_blocked or (
             cfg_result.valid and not isinstance(cfg_result.data, dict)
         ) or (not cfg_result.valid and not cfg_result.missing):
@@ -573,7 +640,9 @@ class GMWindow(QtWidgets.QMainWindow):
             "shortcuts": self._shortcuts,
             "overlay": overlay,
         })
-        write_json(CONFIG_FP, cfg)
+        if not (cfg_result.valid and cfg == cfg_result.data):  # skip rewriting identical settings
+            write_json(CONFIG_FP, cfg)
+        self._remember_config(cfg)
         self._config_document = dict(cfg)
         return True
 
@@ -616,31 +685,45 @@ class GMWindow(QtWidgets.QMainWindow):
     def _toast(self, message: str):
         self.statusBar().showMessage(message, 3000)
 
+    def _list_themes(self) -> List[str]:
+        """Theme folder names under THEMES_DIR, rechecked only when a folder changes.
+
+        Adding or removing a theme.json changes its folder's mtime, so the key
+        covers THEMES_DIR and each theme folder."""
+        try:
+            with os.scandir(THEMES_DIR) as it:
+                folders = sorted(
+                    ((entry.name, entry.stat().st_mtime_ns) for entry in it if entry.is_dir()),
+                    key=lambda folder: os.path.normcase(folder[0]),
+                )
+            key = (THEMES_DIR.stat().st_mtime_ns, tuple(folders))
+        except OSError:
+            key = None
+        cached = self._themes_cache
+        if cached is None or cached[0] != key:
+            folders = key[1] if key is not None else ()
+            names = [name for name, _mtime in folders if (THEMES_DIR / name / "theme.json").exists()]
+            cached = self._themes_cache = (key, names)
+        names = cached[1]
+        if not names:
+            names = [self.theme_name] if self.theme_name else ["gm_modern"]
+        return names
+
     def _populate_themes_combo(self):
         self.cmbTheme.clear()
-        names=[]
-        try:
-            if THEMES_DIR.exists():
-                for p in sorted(THEMES_DIR.iterdir()):
-                    if p.is_dir() and (p/"theme.json").exists(): names.append(p.name)
-        except Exception:
-            pass
-        if not names:
-            names = [self.theme_name] if self.theme_name else ["gm_modern"]
+        names = self._list_themes()
         for theme_id in names:
             self.cmbTheme.addItem(OVERLAY_THEME_LABELS.get(theme_id, theme_id), theme_id)
 
     def _populate_themes_menu(self):
+        names = self._list_themes()
+        if names == self._themes_menu_names:
+            # Same themes as last time: only the checked entry can have changed.
+            for act in self._themes_menu.actions():
+                act.setChecked(act.data() == self.theme_name)
+            return
+        self._themes_menu_names = names
         self._themes_menu.clear()
-        names=[]
-        try:
-            if THEMES_DIR.exists():
-                for p in sorted(THEMES_DIR.iterdir()):
-                    if p.is_dir() and (p/"theme.json").exists(): names.append(p.name)
-        except Exception:
-            pass
-        if not names:
-            names = [self.theme_name] if self.theme_name else ["gm_modern"]
         group = QtGui.QActionGroup(self)
         group.setExclusive(True)
         for theme_id in names:
@@ -694,10 +777,30 @@ class GMWindow(QtWidgets.QMainWindow):
                 self.overlay_win.mode = self.mode
                 self.overlay_win.repaint()
 
+    def _load_overlay_class(self) -> bool:
+        if self._OverlayClass is not None:
+            return True
+        try:
+            from tracker_overlay import Overlay
+        except Exception as error:
+            self._log(f"Overlay module could not be loaded: {type(error).__name__}: {error}")
+            self.btnOverlay.setEnabled(False)
+            return False
+        self._OverlayClass = Overlay
+        return True
+
     def _set_overlay(self, on: bool):
+        if on and not self._load_overlay_class():
+            self.overlay_on = False
+            with QtCore.QSignalBlocker(self.btnOverlay):
+                self.btnOverlay.setChecked(False)
+            self.btnOverlay.setText("Overlay OFF")
+            self._toast("Overlay is unavailable. See the session log.")
+            return
         self.overlay_on = on
         self.btnOverlay.setText("Overlay ON" if on else "Overlay OFF")
         if on:
+            from tracker_overlay import overlay_runtime_log
             try:
                 if not self.overlay_win:
                     overlay_runtime_log("GM requested overlay creation")
@@ -719,14 +822,14 @@ class GMWindow(QtWidgets.QMainWindow):
                 overlay_runtime_log("GM overlay initialization failed", error)
                 self.overlay_win = None
                 self.overlay_on = False
-                self.btnOverlay.blockSignals(True)
-                self.btnOverlay.setChecked(False)
-                self.btnOverlay.blockSignals(False)
+                with QtCore.QSignalBlocker(self.btnOverlay):
+                    self.btnOverlay.setChecked(False)
                 self.btnOverlay.setText("Overlay OFF")
                 self._toast(
                     "Overlay could not be started. See the EncounterOS overlay log."
                 )
         elif self.overlay_win:
+            from tracker_overlay import overlay_runtime_log
             self.overlay_win.hide()
             overlay_runtime_log("GM overlay hidden")
 
@@ -734,9 +837,12 @@ class GMWindow(QtWidgets.QMainWindow):
         self.btnOverlay.setChecked(not self.btnOverlay.isChecked())
 
     def _reload_now(self):
-        self._persist_config()
-        self.combat_tab._persist_party()
-        self.dialog_tab._persist_dialog()
+        self._persist_config_now()
+        self.combat_tab._persist_party_now()
+        # Wait for the queued party write so the overlay reloads the new file.
+        self.combat_tab._flush_persist_party()
+        self.dialog_tab._flush_dialog()
+        self.dialog_tab._flush_persist_dialog()
         self._toast("Requested overlay reload.")
 
     def _set_auto_refresh(self, on: bool):
@@ -783,42 +889,39 @@ class GMWindow(QtWidgets.QMainWindow):
         self._persist_config()
 
     def _apply_ui_theme(self, dark: bool):
-        self.setStyleSheet(DARK_QSS if dark else LIGHT_QSS)
+        qss = DARK_QSS if dark else LIGHT_QSS
+        if qss is self._applied_qss:
+            return  # re-setting the same sheet still re-polishes every widget
+        self._applied_qss = qss
+        self.setStyleSheet(qss)
 
     def _sync_toolbar(self):
         if hasattr(self, "btnOverlay"):
-            old = self.btnOverlay.blockSignals(True)
-            self.btnOverlay.setChecked(self.overlay_on)
-            self.btnOverlay.blockSignals(old)
+            with QtCore.QSignalBlocker(self.btnOverlay):
+                self.btnOverlay.setChecked(self.overlay_on)
         if hasattr(self, "btnMode"):
-            old = self.btnMode.blockSignals(True)
-            self.btnMode.setChecked(self.mode == "combat")
-            self.btnMode.blockSignals(old)
+            with QtCore.QSignalBlocker(self.btnMode):
+                self.btnMode.setChecked(self.mode == "combat")
             self._update_mode_button_text()
         if hasattr(self, "cmbTheme"):
             idx = self.cmbTheme.findData(self.theme_name)
             if idx >= 0:
-                old = self.cmbTheme.blockSignals(True)
-                self.cmbTheme.setCurrentIndex(idx)
-                self.cmbTheme.blockSignals(old)
+                with QtCore.QSignalBlocker(self.cmbTheme):
+                    self.cmbTheme.setCurrentIndex(idx)
         if hasattr(self, "actDarkMode"):
-            old = self.actDarkMode.blockSignals(True)
-            self.actDarkMode.setChecked(self.ui_dark)
-            self.actDarkMode.blockSignals(old)
+            with QtCore.QSignalBlocker(self.actDarkMode):
+                self.actDarkMode.setChecked(self.ui_dark)
         if hasattr(self, "actAutoRefresh"):
-            old = self.actAutoRefresh.blockSignals(True)
-            self.actAutoRefresh.setChecked(self.auto_refresh)
-            self.actAutoRefresh.blockSignals(old)
+            with QtCore.QSignalBlocker(self.actAutoRefresh):
+                self.actAutoRefresh.setChecked(self.auto_refresh)
         if hasattr(self, "actShowSecondaryMetrics"):
-            old = self.actShowSecondaryMetrics.blockSignals(True)
-            self.actShowSecondaryMetrics.setChecked(self.show_secondary_combat_metrics)
-            self.actShowSecondaryMetrics.blockSignals(old)
+            with QtCore.QSignalBlocker(self.actShowSecondaryMetrics):
+                self.actShowSecondaryMetrics.setChecked(self.show_secondary_combat_metrics)
         for disclosure, action in getattr(
             self, "_enemy_health_actions", {}
         ).items():
-            old = action.blockSignals(True)
-            action.setChecked(disclosure == self.enemy_health_disclosure)
-            action.blockSignals(old)
+            with QtCore.QSignalBlocker(action):
+                action.setChecked(disclosure == self.enemy_health_disclosure)
         self._populate_themes_menu()
 
     def _ov_set_screen(self, name: str | None):
@@ -849,10 +952,19 @@ class GMWindow(QtWidgets.QMainWindow):
 
     def _log(self, text: str):
         entry = f"[{now_iso()}] {text}"
-        with LOG_FILE.open("a", encoding="utf-8") as f:
-            f.write(entry + "\n")
+        self._log_buffer.append(entry + "\n")
+        self._log_flush_timer.start()
         print(entry)
 
+    def _flush_log(self):
+        self._log_flush_timer.stop()
+        if not self._log_buffer:
+            return
+        text = "".join(self._log_buffer)
+        self._log_buffer.clear()
+        with LOG_FILE.open("a", encoding="utf-8") as f:
+            f.write(text)
+
     def _export_backup(self):
         from datetime import datetime
         stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
@@ -952,8 +1064,14 @@ class GMWindow(QtWidgets.QMainWindow):
                 a.ignore()
                 return
         
+        self._flush_persist_config()
         self._save_window_layout()
+        self.combat_tab._flush_persist_party()
+        self.dialog_tab._flush_persist_dialog()
+        self.notes_tab._stop_preview_render()
+        self._flush_log()
         if self.overlay_win:
+            from tracker_overlay import overlay_runtime_log
             overlay_runtime_log("GM overlay closing with application")
             self.overlay_win.close()
         a.accept()
@@ -964,15 +1082,24 @@ class ThemePreviewDelegate(QtWidgets.QStyledItemDelegate):
     def __init__(self, parent=None, themes_dir=None):
         super().__init__(parent)
         self._themes_dir = themes_dir or THEMES_DIR
+        self._preview_colors: Dict[str, tuple[int, str]] = {}  # theme -> (mtime_ns, color)
 
     def _theme_preview_color(self, theme_name: str) -> str:
         if not theme_name or not self._themes_dir:
             return "#333333"
+        try:
+            mtime = (self._themes_dir / theme_name / "theme.json").stat().st_mtime_ns
+        except OSError:
+            return "#333333"
+        cached = self._preview_colors.get(theme_name)
+        if cached is None or cached[0] != mtime:
+            cached = self._preview_colors[theme_name] = (mtime, self._read_preview_color(theme_name))
+        return cached[1]
+
+    def _read_preview_color(self, theme_name: str) -> str:
         try:
             fp = self._themes_dir / theme_name / "theme.json"
-            if not fp.exists():
-                return "#333333"
-            data = json.load(fp.open("r", encoding="utf-8"))
+            data = json_loads(fp.read_bytes())
             colors = (data.get("vars") or {}).get("colors") or {}
             return colors.get("card_bg") or colors.get("dialog_bg") or colors.get("border_idle") or "#333333"
         except Exception:
@@ -1089,7 +1216,7 @@ class StatusEditorDialog(QtWidgets.QDialog):
         self.setWindowTitle("Edit Statuses")
         self.setMinimumWidth(300)
         self.current_statuses = current_statuses
-        self.catalog = catalog
+        self.catalog: list[str] = []
         self.parent = parent
         self.cbs = {}
 
@@ -1097,16 +1224,28 @@ class StatusEditorDialog(QtWidgets.QDialog):
         self.list = QtWidgets.QListWidget()
         self.list.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         v.addWidget(self.list)
-
-        for s in sorted(self.catalog, key=str.lower):
-            item = QtWidgets.QListWidgetItem(s)
-            item.setFlags(item.flags() | QtCore.Qt.ItemIsUserCheckable)
-            item.setCheckState(QtCore.Qt.Checked if s in current_statuses else QtCore.Qt.Unchecked)
-            self.list.addItem(item)
             
         box = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
         box.accepted.connect(self.accept); box.rejected.connect(self.reject)
         v.addWidget(box)
+        self.set_statuses(current_statuses, catalog)
+
+    def set_statuses(self, current_statuses: list[str], catalog: list[str]):
+        """Check current_statuses; the items are rebuilt only when the catalog changed."""
+        self.current_statuses = current_statuses
+        if catalog != self.catalog:
+            self.catalog = list(catalog)
+            self.list.clear()
+            for s in sorted(self.catalog, key=str.lower):
+                item = QtWidgets.QListWidgetItem(s)
+                item.setFlags(item.flags() | QtCore.Qt.ItemIsUserCheckable)
+                self.list.addItem(item)
+        current = set(current_statuses)
+        for i in range(self.list.count()):
+            item = self.list.item(i)
+            item.setCheckState(QtCore.Qt.Checked if item.text() in current else QtCore.Qt.Unchecked)
+        self.list.clearSelection()
+        self.list.scrollToTop()
 
     def payload(self) -> list[str]:
         out = []
@@ -4,9 +4,11 @@ import random
 import shutil
 import stat
 import tempfile
+import time
 import zipfile
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
 from typing import Any, List, Dict, Optional, Tuple
 
@@ -17,14 +19,26 @@ except Exception:
     _MD_LIB = None
     _HAS_PY_MARKDOWN = False
 
+try:
+    import orjson as _ORJSON  # pip install orjson (optional, faster load/save)
+except Exception:
+    _ORJSON = None
+
+
+_now_iso_cache: Tuple[int, str] = (-1, "")
 
 def now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    # Whole-second stamps: reuse the formatted string until the second changes.
+    global _now_iso_cache
+    t = int(time.time())
+    if _now_iso_cache[0] != t:
+        _now_iso_cache = (t, datetime.fromtimestamp(t, timezone.utc).isoformat())
+    return _now_iso_cache[1]
 
 def slug(s: str) -> str:
     return "-".join((s or "").strip().lower().split())
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JsonLoadResult:
     path: Path
     status: str
@@ -43,13 +57,13 @@ class JsonLoadResult:
 def load_json(path: Path) -> JsonLoadResult:
     path = Path(path)
     try:
-        text = path.read_text(encoding="utf-8")
+        raw = path.read_bytes()
     except FileNotFoundError:
         return JsonLoadResult(path, "missing")
     except Exception as e:
         return JsonLoadResult(path, "invalid", error=str(e))
     try:
-        return JsonLoadResult(path, "valid", data=json.loads(text))
+        return JsonLoadResult(path, "valid", data=json_loads(raw))
     except Exception as e:
         return JsonLoadResult(path, "invalid", error=str(e))
 
@@ -59,6 +73,15 @@ def safe_json(path: Path, default):
     return result.data if result.valid else default
 
 
+def clone_json(value: Any) -> Any:
+    """Copy a JSON-shaped value; only dicts and lists are mutable containers."""
+    if isinstance(value, dict):
+        return {k: clone_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [clone_json(v) for v in value]
+    return value
+
+
 def config_bool(value: Any, default: bool = False) -> bool:
     if isinstance(value, bool):
         return value
@@ -99,38 +122,109 @@ def atomic_write_text(path: Path, text: str, encoding: str = "utf-8"):
     atomic_write_bytes(Path(path), text.encode(encoding))
 
 
-def write_json(path: Path, data: Any):
-    atomic_write_text(Path(path), json.dumps(data, indent=2), encoding="utf-8")
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if _ORJSON is not None:
+        try:
+            return _ORJSON.loads(data)
+        except _ORJSON.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which the stdlib parser accepts.
+            pass
+    return json.loads(data)
+
+
+def json_bytes(data: Any, compact: bool = False) -> bytes:
+    """Encode data exactly as write_json stores it.
 
+    compact drops indentation and separator spaces for files that only the
+    app and overlay read, such as the live dialog blocks."""
+    if _ORJSON is not None:
+        try:
+            if compact:
+                return _ORJSON.dumps(data)
+            return _ORJSON.dumps(data, option=_ORJSON.OPT_INDENT_2)
+        except TypeError:
+            # Non-string keys, huge ints, etc. still go through the stdlib.
+            pass
+    if compact:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def json_signature(data: Any) -> bytes:
+    """Compact, key-sorted encoding of data for use as a cache key."""
+    if _ORJSON is not None:
+        try:
+            return _ORJSON.dumps(data, default=str, option=_ORJSON.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(data, sort_keys=True, default=str, separators=(",", ":")).encode("utf-8")
+
+
+def list_json_stems(directory: Path) -> List[str]:
+    """Names of the *.json files in directory, sorted, from one scandir pass."""
+    try:
+        with os.scandir(directory) as entries:
+            names = [
+                entry.name[:-5]
+                for entry in entries
+                if entry.name.endswith(".json")
+                and not entry.name.startswith(".")  # glob("*.json") skipped dotfiles
+                and entry.is_file()
+            ]
+    except OSError:
+        return []
+    names.sort(key=os.path.normcase)  # same order sorted(Path) gave per platform
+    return names
+
+
+def write_json(path: Path, data: Any, compact: bool = False):
+    atomic_write_bytes(Path(path), json_bytes(data, compact=compact))
 
-def write_dialog_txt(blocks: List[str]):
-    text = "\n\n".join(b.strip() for b in blocks if b.strip())
-    path = Path("dialog.txt")
-    atomic_write_text(path, text, encoding="utf-8")
 
 def collect_suffixes(base_name: str, names: List[str]) -> set:
+    """Suffixes already taken for base_name: "" for the bare name, "A" for
+    either "Base (A)" or "Base A"."""
     base = base_name.strip()
+    prefix = base + " "
+    cut = len(prefix)
     out = set()
     for n in names:
         if n == base:
             out.add("")
-        if n.startswith(base + " "):
-            tail = n[len(base)+1:].strip()
+        elif n.startswith(prefix):
+            tail = n[cut:].strip()
+            # Duplicates are named "Base (A)"; also accept a bare "Base A".
+            if tail.startswith("(") and tail.endswith(")"):
+                tail = tail[1:-1].strip()
             if tail:
                 out.add(tail)
     return out
 
-def next_suffix(not_in: set) -> str:
-    for i in range(26):
-        s = chr(65+i)
-        if s not in not_in:
-            return s
+_SUFFIX_LETTERS = tuple(chr(65 + i) for i in range(26))
+
+def iter_suffixes():
+    """Yield duplicate suffixes in order: A..Z, then A1, A2, ..."""
+    yield from _SUFFIX_LETTERS
     k = 1
     while True:
-        s = f"A{k}"
-        if s not in not_in:
-            return s
+        yield f"A{k}"
+        k += 1
+
+def next_suffix(not_in: set) -> str:
+    """First suffix from iter_suffixes() that is not in not_in."""
+    for letter in _SUFFIX_LETTERS:
+        if letter not in not_in:
+            return letter
+    # Past Z: find the smallest free A<k> from the numbers in use, not by probing strings.
+    used = {
+        int(s[1:]) for s in not_in
+        if s[:1] == "A" and s[1:].isascii() and s[1:].isdigit() and s[1:2] != "0"
+    }
+    k = 1
+    while k in used:
         k += 1
+    return f"A{k}"
 
 def parse_rank(value) -> Tuple[float, str]:
     if value is None:
@@ -139,14 +233,18 @@ def parse_rank(value) -> Tuple[float, str]:
         v = float(value)
         txt = str(int(v)) if v.is_integer() else str(v)
         return v, txt
-    s = str(value).strip()
+    return _parse_rank_text(str(value))
+
+@lru_cache(maxsize=256)
+def _parse_rank_text(value: str) -> Tuple[float, str]:
+    # Rosters repeat a handful of ranks ("1/4", "1/2", "1".."20") across every row.
+    s = value.strip()
     if not s:
         return 0.0, "0"
     if "/" in s:
+        num, _, den = s.partition("/")
         try:
-            num, den = s.split("/", 1)
-            v = float(num) / float(den)
-            return v, s
+            return float(num) / float(den), s
         except Exception:
             pass
     try:
@@ -168,10 +266,30 @@ def rank_label_for_pack(system: str | None, pack_rank_label: str | None) -> str:
         return _RANK_LABEL_MAP.get(str(system).strip().lower(), "Rank")
     return "Rank"
 
+def uuid4_strs(count: int) -> List[str]:
+    """Return count random (version 4) UUID strings from one os.urandom call."""
+    raw = bytearray(os.urandom(16 * count))
+    out = []
+    for i in range(0, 16 * count, 16):
+        raw[i + 6] = (raw[i + 6] & 0x0F) | 0x40  # version 4
+        raw[i + 8] = (raw[i + 8] & 0x3F) | 0x80  # RFC 4122 variant
+        h = raw[i:i + 16].hex()
+        out.append(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}")
+    return out
+
+
 def roll_d20() -> int:
     return random.randint(1, 20)
 
 
+_D20_FACES = range(1, 21)
+
+
+def roll_d20s(count: int) -> List[int]:
+    """Roll count d20s in one call instead of one randint() per die."""
+    return random.choices(_D20_FACES, k=count)
+
+
 def roll_dice(formula: str) -> Tuple[int, str]:
     """Parse a formula like '1d20+5', '2d6', 'd20', '3d8-2' and return (total, breakdown_str)."""
     import re
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Callable, Iterable, Sequence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TextBox:
     x: int
     y: int
@@ -2,7 +2,6 @@ import os
 import sys
 from PySide6 import QtCore, QtWidgets
 from gm_window import GMWindow
-from tracker_overlay import overlay_runtime_log
 
 
 def create_application(argv=None):
@@ -14,6 +13,8 @@ def create_application(argv=None):
 
 def schedule_overlay_smoke_test(app, window):
     """Frozen/source lifecycle probe enabled only by an explicit environment flag."""
+    from tracker_overlay import overlay_runtime_log
+
     def show_overlay():
         overlay_runtime_log("Overlay smoke test toggling on")
         window.btnOverlay.setChecked(True)
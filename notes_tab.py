@@ -3,20 +3,43 @@ from PySide6 import QtWidgets, QtCore
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWebChannel import QWebChannel
 from pathlib import Path
+import time
 import markdown
 
 from app_paths import VAULT_DIR
 from helpers import atomic_write_text
 from styles import MD_CSS
 
+# One converter for every render; markdown.markdown() builds a new one, with all
+# its processors, per call. reset() clears per-document state between uses.
+# Only the notes render thread touches it.
+_MARKDOWN = markdown.Markdown()
+
+
 class NotesTab(QtWidgets.QWidget):
+    _PREVIEW_DELAY_MS = 250
+    previewRendered = QtCore.Signal(int, str, str, int)  # generation, source, html, render ms
+
     def __init__(self, parent: QtWidgets.QMainWindow):
         super().__init__()
         self.parent = parent
         self._notes_files = []
+        self._notes_cache: tuple[int | None, list[Path]] = (None, [])  # (vault mtime_ns, files)
         self._current_note_fp: Path | None = None
         self._current_note_row = -1
         self._saved_content = ""  # Track saved content to detect unsaved changes
+        self._preview_source: str | None = None  # text the preview was last rendered from
+        # Typing re-renders the preview once per pause; slow renders stretch the pause.
+        self._preview_timer = QtCore.QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(self._PREVIEW_DELAY_MS)
+        self._preview_timer.timeout.connect(self._render_preview)
+        # One render thread keeps Markdown conversion off the UI thread; only the
+        # newest submission's result is shown.
+        self._render_pool = QtCore.QThreadPool(self)
+        self._render_pool.setMaxThreadCount(1)
+        self._preview_generation = 0
+        self.previewRendered.connect(self._apply_preview)
         self._build_ui()
         self._load_notes_list()
 
@@ -52,20 +75,33 @@ class NotesTab(QtWidgets.QWidget):
         
         # Signals
         self.notes_list.currentRowChanged.connect(self._on_note_selected)
-        self.editor.textChanged.connect(self._update_preview)
+        self.editor.textChanged.connect(self._preview_timer.start)
         self.btnSave.clicked.connect(self._save_note)
         self.btnNew.clicked.connect(self._new_note)
         
+    def _note_files(self) -> list[Path]:
+        """Sorted notes, re-globbed only when the vault folder changes."""
+        try:
+            mtime = VAULT_DIR.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        cached_mtime, files = self._notes_cache
+        if mtime is None or mtime != cached_mtime:
+            files = sorted(VAULT_DIR.glob("*.md"))
+            self._notes_cache = (mtime, files)
+        return list(files)
+
     def _load_notes_list(self, select_fp: Path | None = None):
-        old = self.notes_list.blockSignals(True)
-        self.notes_list.clear()
-        self._notes_files = sorted(VAULT_DIR.glob("*.md"))
-        for fp in self._notes_files:
-            self.notes_list.addItem(fp.stem)
-        target = select_fp or self._current_note_fp
-        row = self._notes_files.index(target) if target in self._notes_files else (0 if self._notes_files else -1)
-        self.notes_list.setCurrentRow(row)
-        self.notes_list.blockSignals(old)
+        files = self._note_files()
+        with QtCore.QSignalBlocker(self.notes_list):
+            # Only rebuild the items when the set of note files changed.
+            if files != self._notes_files or self.notes_list.count() != len(files):
+                self.notes_list.clear()
+                self.notes_list.addItems([fp.stem for fp in files])
+            self._notes_files = files
+            target = select_fp or self._current_note_fp
+            row = self._notes_files.index(target) if target in self._notes_files else (0 if self._notes_files else -1)
+            self.notes_list.setCurrentRow(row)
         if row >= 0 and (self._current_note_fp != self._notes_files[row] or self._current_note_row != row):
             self._on_note_selected(row)
 
@@ -75,9 +111,8 @@ class NotesTab(QtWidgets.QWidget):
         if self._current_note_fp == self._notes_files[row] and self._current_note_row == row:
             return
         if not self._confirm_unsaved_changes():
-            old = self.notes_list.blockSignals(True)
-            self.notes_list.setCurrentRow(self._current_note_row)
-            self.notes_list.blockSignals(old)
+            with QtCore.QSignalBlocker(self.notes_list):
+                self.notes_list.setCurrentRow(self._current_note_row)
             return
         next_fp = self._notes_files[row]
         try:
@@ -85,15 +120,14 @@ class NotesTab(QtWidgets.QWidget):
                 text = f.read()
         except (OSError, UnicodeError) as e:
             QtWidgets.QMessageBox.critical(self, "Open Note Failed", str(e))
-            old = self.notes_list.blockSignals(True)
-            self.notes_list.setCurrentRow(self._current_note_row)
-            self.notes_list.blockSignals(old)
+            with QtCore.QSignalBlocker(self.notes_list):
+                self.notes_list.setCurrentRow(self._current_note_row)
             return
         self._current_note_fp = next_fp
         self._current_note_row = row
         self.editor.setPlainText(text)
         self._saved_content = text  # Track what's saved
-        self._update_preview()
+        self._render_preview()
 
     def _confirm_unsaved_changes(self) -> bool:
         if not self.has_unsaved_changes():
@@ -157,7 +191,36 @@ class NotesTab(QtWidgets.QWidget):
         # New note is already saved, so track it
         self._saved_content = initial_content
         
-    def _update_preview(self):
-        html = markdown.markdown(self.editor.toPlainText())
-        html = f"<html><head>{MD_CSS}</head><body>{html}</body></html>"
+    def _render_preview(self):
+        self._preview_timer.stop()
+        text = self.editor.toPlainText()
+        if text == self._preview_source:
+            return
+        self._preview_generation += 1
+        generation = self._preview_generation
+
+        def run():
+            started = time.perf_counter()
+            html = _MARKDOWN.reset().convert(text)
+            html = f"<html><head>{MD_CSS}</head><body>{html}</body></html>"
+            elapsed_ms = int((time.perf_counter() - started) * 1000)
+            self.previewRendered.emit(generation, text, html, elapsed_ms)
+
+        # A render still waiting for the thread is superseded by this one.
+        self._render_pool.clear()
+        self._render_pool.start(run)
+
+    def _stop_preview_render(self):
+        """Drop queued renders and wait out the running one; its result is discarded."""
+        self._preview_timer.stop()
+        self._preview_generation += 1
+        self._render_pool.clear()
+        self._render_pool.waitForDone()
+
+    def _apply_preview(self, generation: int, source: str, html: str, elapsed_ms: int):
+        if generation != self._preview_generation:
+            return
+        self._preview_source = source
         self.preview.setHtml(html)
+        # Wait at least twice as long as a render took before the next one.
+        self._preview_timer.setInterval(max(self._PREVIEW_DELAY_MS, 2 * elapsed_ms))
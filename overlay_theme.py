@@ -7,6 +7,8 @@ from typing import Any, Mapping
 
 from PySide6.QtGui import QColor, QFontDatabase
 
+from helpers import json_loads
+
 
 SUPPORTED_RENDERER_MODES = {
     "gm_modern",
@@ -221,8 +223,7 @@ def parse_overlay_theme(document: Any) -> dict[str, Any]:
 
 def load_overlay_theme(path: Path) -> dict[str, Any]:
     try:
-        with Path(path).open("r", encoding="utf-8") as source:
-            return parse_overlay_theme(json.load(source))
+        return parse_overlay_theme(json_loads(Path(path).read_bytes()))
     except (OSError, UnicodeError, json.JSONDecodeError):
         return deepcopy(DEFAULT_OVERLAY_THEME)
 
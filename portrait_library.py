@@ -562,32 +562,31 @@ class DialogBlockEditor(QtWidgets.QDialog):
         if selected is None:
             selected = self._original.get("portrait_id")
         explicit = self._original.get("portrait")
-        self.portrait.blockSignals(True)
-        self.portrait.clear()
-        if isinstance(explicit, str) and explicit.strip():
-            self.portrait.addItem(
-                f"Custom image — {Path(explicit).name}", ("custom", explicit)
-            )
-        self.portrait.addItem("Use Default", ("default", None))
-        entity = self._speaker_entity()
-        if entity is not None:
-            for index, entry in enumerate(normalized_portraits(entity)):
-                label = str(entry.get("label") or f"Portrait {index + 1}")
-                if index == 0:
-                    label = f"{label} (Default)"
-                self.portrait.addItem(label, ("portrait", entry.get("id")))
-        target = -1
-        for index in range(self.portrait.count()):
-            kind, value = self.portrait.itemData(index)
-            if selected == value or selected == (kind, value):
-                target = index
-                break
-        if target < 0:
-            target = 0 if isinstance(explicit, str) and explicit.strip() else (
-                self.portrait.findData(("default", None))
-            )
-        self.portrait.setCurrentIndex(max(0, target))
-        self.portrait.blockSignals(False)
+        with QtCore.QSignalBlocker(self.portrait):
+            self.portrait.clear()
+            if isinstance(explicit, str) and explicit.strip():
+                self.portrait.addItem(
+                    f"Custom image — {Path(explicit).name}", ("custom", explicit)
+                )
+            self.portrait.addItem("Use Default", ("default", None))
+            entity = self._speaker_entity()
+            if entity is not None:
+                for index, entry in enumerate(normalized_portraits(entity)):
+                    label = str(entry.get("label") or f"Portrait {index + 1}")
+                    if index == 0:
+                        label = f"{label} (Default)"
+                    self.portrait.addItem(label, ("portrait", entry.get("id")))
+            target = -1
+            for index in range(self.portrait.count()):
+                kind, value = self.portrait.itemData(index)
+                if selected == value or selected == (kind, value):
+                    target = index
+                    break
+            if target < 0:
+                target = 0 if isinstance(explicit, str) and explicit.strip() else (
+                    self.portrait.findData(("default", None))
+                )
+            self.portrait.setCurrentIndex(max(0, target))
         current = self.portrait.currentData()
         self.use_speaker_library.setVisible(
             bool(current and current[0] == "custom")
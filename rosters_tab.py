@@ -1,14 +1,15 @@
 # rosters_tab.py — Packs with Systems + Ranks + Multi-pack selection
 from __future__ import annotations
+import sys
 from PySide6 import QtWidgets, QtCore
-from copy import deepcopy
 from pathlib import Path
 from typing import Dict, Any, List, Tuple
+from bisect import bisect_right
 
 from app_paths import ROSTERS_DIR
 from helpers import (
-    safe_json, write_json, collect_suffixes, next_suffix,
-    parse_rank, rank_label_for_pack,
+    clone_json, safe_json, write_json, collect_suffixes, next_suffix,
+    parse_rank, rank_label_for_pack, list_json_stems,
 )
 from combat_metrics import initialize_live_metric_fields, resolve_combat_metric
 from portrait_library import PORTRAIT_SOURCE_DIR_FIELD
@@ -16,12 +17,88 @@ from combat_tab import ensure_live_combat_instance_ids
 
 Pack = Dict[str, Any]
 
+
+def _entry_haystack(m: Dict) -> str:
+    return " ".join([m.get("name",""), " ".join(m.get("tags") or [])]).lower()
+
+
+def _intern_entry_tags(entries: List[Dict]) -> None:
+    """Share one string object per distinct tag; the same few tags repeat across every pack."""
+    for m in entries:
+        tags = m.get("tags")
+        if isinstance(tags, list):
+            m["tags"] = [sys.intern(t) if type(t) is str else t for t in tags]
+
+
+def _entry_label(m: Dict, rank_label: str) -> str:
+    # Show as: Name — RankLabel: X — [Allies/Opponents]
+    side = (m.get("side_default") or "").lower()
+    side_tag = "Allies" if side == "allies" else ("Opponents" if side == "opponents" else "Neutral")
+    _, txt = parse_rank(m.get("rank"))
+    return f"{m.get('name','Unknown')} — {rank_label}: {txt or '0'} — {side_tag}"
+
+
+def _search_rows(pack: Pack, query: str) -> List[int]:
+    """Indices of pack entries whose haystack contains query, found by one scan of the joined text."""
+    text, starts = pack["search_text"], pack["search_starts"]
+    rows: List[int] = []
+    pos = text.find(query)
+    while pos != -1:
+        row = bisect_right(starts, pos) - 1
+        rows.append(row)
+        # Continue from the next entry; one hit per entry is enough.
+        if row + 1 >= len(starts):
+            break
+        pos = text.find(query, starts[row + 1])
+    return rows
+
+
+class RosterEntriesModel(QtCore.QAbstractListModel):
+    """Filtered roster entries; each row is a label plus its (entry, pack) payload."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._labels: List[str] = []
+        self._payloads: List[Tuple[Dict, Pack]] = []
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._labels)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self._labels[row]
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            return self._payloads[row]
+        return None
+
+    def set_rows(self, labels: List[str], payloads: List[Tuple[Dict, Pack]]):
+        self.beginResetModel()
+        self._labels = labels
+        self._payloads = payloads
+        self.endResetModel()
+
+    def payloads(self) -> List[Tuple[Dict, Pack]]:
+        return list(self._payloads)
+
+
 class RostersTab(QtWidgets.QWidget):
     def __init__(self, parent: QtWidgets.QMainWindow):
         super().__init__(parent)
         self.parent = parent
         self._packs: List[Pack] = []           # normalized pack meta
         self._rank_values_sorted: List[Tuple[float, str]] = []  # (numeric, label)
+        self._roster_cache: Tuple[int | None, List[Path]] = (None, [])  # (dir mtime_ns, files)
+        self._pack_cache: Dict[Path, Tuple[int, Pack]] = {}  # file -> (mtime_ns, normalized pack)
+        self._selected_packs: List[Pack] | None = None  # cleared when the pack selection changes
+        self._entries_dirty = False  # entries view skipped while the tab was hidden
+        # Typing in the search box rebuilds the entries view once per burst, not per key.
+        self._search_timer = QtCore.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(120)
+        self._search_timer.timeout.connect(self._refresh_entries_view)
         self._build_ui()
         self._wire()
         self._load_packs()
@@ -66,7 +143,11 @@ class RostersTab(QtWidgets.QWidget):
 
         # Right: entries list + add buttons
         right = QtWidgets.QWidget(); vR = QtWidgets.QVBoxLayout(right)
-        self.listEntries = QtWidgets.QListWidget()
+        self.entries_model = RosterEntriesModel(self)
+        self.listEntries = QtWidgets.QListView()
+        self.listEntries.setProperty("panelList", True)
+        self.listEntries.setModel(self.entries_model)
+        self.listEntries.setUniformItemSizes(True)  # one-line rows; skips per-row size hints
         self.listEntries.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         vR.addWidget(self.listEntries)
 
@@ -82,37 +163,97 @@ class RostersTab(QtWidgets.QWidget):
 
     def _wire(self):
         # packs / filters
-        self.listPacks.itemSelectionChanged.connect(self._refresh_entries_view)
+        self.listPacks.itemSelectionChanged.connect(self._on_pack_selection_changed)
         self.cmbSystem.currentIndexChanged.connect(self._refresh_entries_view)
         self.cmbSide.currentIndexChanged.connect(self._refresh_entries_view)
         self.cmbMinRank.currentIndexChanged.connect(self._refresh_entries_view)
         self.cmbMaxRank.currentIndexChanged.connect(self._refresh_entries_view)
-        self.edSearch.textChanged.connect(self._refresh_entries_view)
+        self.edSearch.textChanged.connect(self._search_timer.start)
         # actions
         self.btnSaveParty.clicked.connect(self._save_party_as_roster)
         self.btnDeletePacks.clicked.connect(self._delete_selected_packs)
         self.btnAddSelected.clicked.connect(self._add_selected_to_combat)
         self.btnAddAll.clicked.connect(self._add_all_filtered_to_combat)
-        self.listEntries.itemDoubleClicked.connect(self._add_one_item)
+        self.listEntries.doubleClicked.connect(self._add_one_item)
 
     # ---------- Load & normalize ----------
+    def _roster_files(self) -> List[Path]:
+        """Sorted roster files, rescanned only when the folder changes."""
+        try:
+            mtime = ROSTERS_DIR.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        cached_mtime, files = self._roster_cache
+        if mtime is None or mtime != cached_mtime:
+            files = [ROSTERS_DIR / f"{stem}.json" for stem in list_json_stems(ROSTERS_DIR)]
+            self._roster_cache = (mtime, files)
+        return files
+
+    def _invalidate_roster_files(self):
+        self._roster_cache = (None, [])
+
+    def _read_pack(self, fp: Path) -> Pack:
+        """Normalized pack for fp, re-parsed only when the file's mtime changes."""
+        try:
+            mtime = fp.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        cached = self._pack_cache.get(fp)
+        if mtime is not None and cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        data = safe_json(fp, {})
+        # Normalize into: {file, name, system, entries: [members], rank_label}
+        name = data.get("name") or fp.stem
+        system = (data.get("system") or "").strip() or None
+        if system:
+            system = sys.intern(system)
+        entries = self._extract_entries(data)
+        _intern_entry_tags(entries)
+        rank_label = rank_label_for_pack(system, None)  # “CR”, “Level”, etc. from helpers.py :contentReference[oaicite:9]{index=9}
+
+        # Lowercased "name tags" per entry, joined with NUL (never typed into the
+        # search box) so one str.find walks the whole pack; starts maps hits to rows.
+        haystacks = [_entry_haystack(m) for m in entries]
+        parsed_ranks = [parse_rank(m.get("rank")) for m in entries]
+        rank_options: Dict[Any, str] = {}
+        for v, txt in parsed_ranks:
+            # keep first text we saw for this numeric value
+            rank_options.setdefault(v, txt)
+        starts, offset = [], 0
+        for hay in haystacks:
+            starts.append(offset)
+            offset += len(hay) + 1
+        pack = {
+            "file": fp, "name": name, "system": system,
+            "entries": entries, "rank_label": rank_label,
+            "source_dir": str(fp.resolve().parent),
+            "search_text": "\0".join(haystacks),
+            "search_starts": starts,
+            # list row text per entry; only which rows are shown changes per refresh
+            "labels": [_entry_label(m, rank_label) for m in entries],
+            # numeric rank and lowercased default side per entry, for the filters
+            "ranks": [v for v, _txt in parsed_ranks],
+            # numeric rank -> first text seen, for the rank combos
+            "rank_options": rank_options,
+            "sides": [sys.intern((m.get("side_default") or "").lower()) for m in entries],
+        }
+        if mtime is not None:
+            self._pack_cache[fp] = (mtime, pack)
+        return pack
+
     def _load_packs(self):
         self._packs.clear()
         self.listPacks.clear()
+        self._selected_packs = None
 
-        for fp in sorted(ROSTERS_DIR.glob("*.json")):
-            data = safe_json(fp, {})
-            # Normalize into: {file, name, system, entries: [members], rank_label}
-            name = data.get("name") or fp.stem
-            system = (data.get("system") or "").strip() or None
-            entries = self._extract_entries(data)
-            rank_label = rank_label_for_pack(system, None)  # “CR”, “Level”, etc. from helpers.py :contentReference[oaicite:9]{index=9}
-
-            pack = {
-                "file": fp, "name": name, "system": system,
-                "entries": entries, "rank_label": rank_label
-            }
+        files = self._roster_files()
+        for stale in self._pack_cache.keys() - set(files):
+            del self._pack_cache[stale]
+        for fp in files:
+            pack = self._read_pack(fp)
             self._packs.append(pack)
+            name, system, entries = pack["name"], pack["system"], pack["entries"]
 
             # show system and count
             suffix = f" [{system}]" if system else ""
@@ -126,23 +267,21 @@ class RostersTab(QtWidgets.QWidget):
             self.cmbSystem.addItem(s, userData=s)
 
         # Build rank options (global) from all packs
-        ranks = []
-        for p in self._packs:
-            for m in p["entries"]:
-                v, txt = parse_rank(m.get("rank"))
-                ranks.append((v, txt))
         uniq = {}
-        for v, txt in ranks:
-            # keep first text we saw for this numeric value
-            if v not in uniq:
-                uniq[v] = txt
+        for p in self._packs:
+            for v, txt in p["rank_options"].items():
+                # keep first text we saw for this numeric value
+                if v not in uniq:
+                    uniq[v] = txt
         self._rank_values_sorted = sorted(((v, uniq[v]) for v in uniq.keys()), key=lambda x: x[0])
 
         def _fill_rank_combo(cmb: QtWidgets.QComboBox):
-            cmb.clear()
-            cmb.addItem("Any", userData=None)
-            for v, txt in self._rank_values_sorted:
-                cmb.addItem(txt, userData=v)
+            # Quiet while refilling; the entries view is rebuilt once below.
+            with QtCore.QSignalBlocker(cmb):
+                cmb.clear()
+                cmb.addItem("Any", userData=None)
+                for v, txt in self._rank_values_sorted:
+                    cmb.addItem(txt, userData=v)
 
         _fill_rank_combo(self.cmbMinRank)
         _fill_rank_combo(self.cmbMaxRank)
@@ -169,46 +308,57 @@ class RostersTab(QtWidgets.QWidget):
         return []
 
     # ---------- View build ----------
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._entries_dirty:
+            self._refresh_entries_view()
+
     def _refresh_entries_view(self):
-        # Collect selected packs
-        selected_packs = [it.data(QtCore.Qt.UserRole) for it in self.listPacks.selectedItems()] or self._packs
+        if not self.isVisible():
+            # Nothing to look at; rebuild once the tab is shown again.
+            self._entries_dirty = True
+            return
+        self._entries_dirty = False
+        self._search_timer.stop()
+        # Collect selected packs; the list only changes with the pack selection
+        if self._selected_packs is None:
+            self._selected_packs = [it.data(QtCore.Qt.UserRole) for it in self.listPacks.selectedItems()]
+        selected_packs = self._selected_packs or self._packs
 
         # Filters
         want_system = self.cmbSystem.currentData()
         side_mode = self.cmbSide.currentText()
+        want_side = {"Allies": "allies", "Opponents": "opponents"}.get(side_mode)
         min_rank = self.cmbMinRank.currentData()
         max_rank = self.cmbMaxRank.currentData()
+        lo = float(min_rank) if min_rank is not None else None
+        hi = float(max_rank) if max_rank is not None else None
         query = (self.edSearch.text() or "").strip().lower()
 
-        # Aggregate, filter, and show entries
-        self.listEntries.clear()
+        # Aggregate and filter entries, then hand them to the model in one reset
+        labels: List[str] = []
+        payloads: List[Tuple[Dict, Pack]] = []
         for pack in selected_packs:
             if want_system and pack["system"] != want_system:
                 continue
-            rlabel = pack["rank_label"]
-            for m in pack["entries"]:
+            entries, entry_labels = pack["entries"], pack["labels"]
+            ranks, sides = pack["ranks"], pack["sides"]
+            rows = _search_rows(pack, query) if query else range(len(entries))
+            for i in rows:
                 # side filter
-                side = (m.get("side_default") or "").lower()
-                if side_mode == "Allies" and side != "allies":
-                    continue
-                if side_mode == "Opponents" and side != "opponents":
-                    continue
-                # rank filter
-                v, txt = parse_rank(m.get("rank"))  # numeric + original text (e.g., “1/8”) :contentReference[oaicite:10]{index=10}
-                if min_rank is not None and v < float(min_rank): continue
-                if max_rank is not None and v > float(max_rank): continue
-                # search filter (name or tags)
-                hay = " ".join([m.get("name",""), " ".join(m.get("tags") or [])]).lower()
-                if query and query not in hay:
+                if want_side and sides[i] != want_side:
                     continue
+                # rank filter, on the numeric rank parsed at load (e.g. “1/8” -> 0.125)
+                if lo is not None and ranks[i] < lo: continue
+                if hi is not None and ranks[i] > hi: continue
+                labels.append(entry_labels[i])
+                payloads.append((entries[i], pack))
+
+        self.entries_model.set_rows(labels, payloads)
 
-                # Show as: Name — RankLabel: X — [Allies/Opponents]
-                name = m.get("name","Unknown")
-                side_tag = "Allies" if side == "allies" else ("Opponents" if side == "opponents" else "Neutral")
-                label = f"{name} — {rlabel}: {txt or '0'} — {side_tag}"
-                it = QtWidgets.QListWidgetItem(label)
-                it.setData(QtCore.Qt.UserRole, (m, pack))
-                self.listEntries.addItem(it)
+    def _on_pack_selection_changed(self):
+        self._selected_packs = None
+        self._refresh_entries_view()
 
     # ---------- Normalize & add ----------
     def _normalize_member(self, m: Dict, pack: Pack) -> Dict:
@@ -220,7 +370,7 @@ class RostersTab(QtWidgets.QWidget):
         side = (m.get("side_default") or "").lower()
         is_pc = (side == "allies")
 
-        out = deepcopy(m)
+        out = clone_json(m)
         out.update({
             "name": m.get("name", "Creature"),
             "initMod": int(init_mod or 0),
@@ -235,29 +385,33 @@ class RostersTab(QtWidgets.QWidget):
         initialize_live_metric_fields(out, metric)
         if not out.get("system"):
             out["system"] = pack.get("system")
-        source = pack.get("file")
-        if source:
-            out.setdefault(PORTRAIT_SOURCE_DIR_FIELD, str(Path(source).resolve().parent))
+        source_dir = pack.get("source_dir")
+        if source_dir:
+            out.setdefault(PORTRAIT_SOURCE_DIR_FIELD, source_dir)
         return out
 
     def _uniqueize_batch(self, members: List[Dict]) -> List[Dict]:
         existing = [x.get("name","") for x in self.parent.combat_tab.combatants]
+        taken_by_base: Dict[str, set] = {}
         uniq = []
-        for i, m in enumerate(members):
-            base = (m.get("name") or "Creature").split(" (")[0]
-            taken = collect_suffixes(base, existing + [x.get("name","") for x in uniq])
-            mm = deepcopy(m)
+        for m in members:
+            base = (m.get("name") or "Creature").partition(" (")[0]
+            # Scan the live names once per base, then track names issued in this batch.
+            taken = taken_by_base.get(base)
+            if taken is None:
+                taken = taken_by_base[base] = collect_suffixes(base, existing)
+            mm = dict(m)  # only the top-level name is changed below
             if "" in taken:  # already a bare duplicate name, add a suffix
                 mm["name"] = f"{base} ({next_suffix(taken)})"
+            taken.update(collect_suffixes(base, [mm.get("name") or ""]))
             uniq.append(mm)
         return uniq
 
-    def _add_payload(self, items: List[QtWidgets.QListWidgetItem]):
+    def _add_payload(self, items: List[Tuple[Dict, Pack]]):
         if not items:
             return
         payload = []
-        for it in items:
-            m, pack = it.data(QtCore.Qt.UserRole)
+        for m, pack in items:
             payload.append(self._normalize_member(m, pack))
         payload = self._uniqueize_batch(payload)
         # Push into Combat and persist/refresh (your CombatTab API) :contentReference[oaicite:12]{index=12}
@@ -268,21 +422,24 @@ class RostersTab(QtWidgets.QWidget):
 
     # Actions
     def _add_selected_to_combat(self):
-        items = self.listEntries.selectedItems()
+        rows = sorted(ix.row() for ix in self.listEntries.selectionModel().selectedRows())
+        items = [self.entries_model.index(r).data(QtCore.Qt.UserRole) for r in rows]
         if not items:
             QtWidgets.QMessageBox.information(self, "Rosters", "Select one or more entries first.")
             return
         self._add_payload(items)
 
     def _add_all_filtered_to_combat(self):
-        n = self.listEntries.count()
-        items = [self.listEntries.item(i) for i in range(n)]
+        if self._search_timer.isActive():  # apply a search typed just before the click
+            self._refresh_entries_view()
+        items = self.entries_model.payloads()
         if not items:
             return
         self._add_payload(items)
 
-    def _add_one_item(self, it: QtWidgets.QListWidgetItem):
-        self._add_payload([it])
+    def _add_one_item(self, index: QtCore.QModelIndex):
+        if index.isValid():
+            self._add_payload([index.data(QtCore.Qt.UserRole)])
 
     # Save/Delete roster files
     def _save_party_as_roster(self):
@@ -295,6 +452,7 @@ class RostersTab(QtWidgets.QWidget):
             return
         fp = ROSTERS_DIR / f"{name.strip()}.json"
         write_json(fp, {"roster": members})
+        self._invalidate_roster_files()
         self.parent._log(f"Saved roster: {fp.name}")
         self._load_packs()
 
@@ -312,4 +470,5 @@ class RostersTab(QtWidgets.QWidget):
             if fp.exists():
                 fp.unlink()
                 self.parent._log(f"Deleted roster file: {fp.name}")
+        self._invalidate_roster_files()
         self._load_packs()
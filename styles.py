@@ -7,7 +7,8 @@ QMainWindow::separator { width: 4px; background: #25272b; }
 QSplitter::handle { background: #25272b; width: 4px; }
 
 /* Inputs: rounded, subtle border */
-QLineEdit, QPlainTextEdit, QTextEdit, QSpinBox, QDoubleSpinBox, QComboBox, QListWidget {
+QLineEdit, QPlainTextEdit, QTextEdit, QSpinBox, QDoubleSpinBox, QComboBox, QListWidget,
+QListView[panelList="true"] {
   background-color: #25272b; color: #e8eaed; border: 1px solid #3c4043;
   border-radius: 8px; padding: 8px 10px; min-height: 20px;
   selection-background-color: #4a7bc2; selection-color: #fff;
@@ -16,9 +17,9 @@ QLineEdit:focus, QPlainTextEdit:focus, QTextEdit:focus, QSpinBox:focus, QComboBo
   border-color: #5a9fd4;
 }
 QComboBox::drop-down { border: none; padding-right: 8px; }
-QListWidget::item { padding: 6px 8px; border-radius: 4px; }
-QListWidget::item:selected { background-color: #3c4043; }
-QListWidget::item:hover:!selected { background-color: #2d3034; }
+QListWidget::item, QListView[panelList="true"]::item { padding: 6px 8px; border-radius: 4px; }
+QListWidget::item:selected, QListView[panelList="true"]::item:selected { background-color: #3c4043; }
+QListWidget::item:hover:!selected, QListView[panelList="true"]::item:hover:!selected { background-color: #2d3034; }
 
 /* Buttons: modern flat-with-hover, rounded */
 QPushButton {
@@ -71,7 +72,8 @@ QWidget { background-color: #f8f9fa; color: #202124; font-family: "Segoe UI", sy
 QMainWindow::separator { width: 4px; background: #e8eaed; }
 QSplitter::handle { background: #e8eaed; width: 4px; }
 
-QLineEdit, QPlainTextEdit, QTextEdit, QSpinBox, QDoubleSpinBox, QComboBox, QListWidget {
+QLineEdit, QPlainTextEdit, QTextEdit, QSpinBox, QDoubleSpinBox, QComboBox, QListWidget,
+QListView[panelList="true"] {
   background-color: #fff; color: #202124; border: 1px solid #dadce0;
   border-radius: 8px; padding: 8px 10px; min-height: 20px;
   selection-background-color: #1a73e8; selection-color: #fff;
@@ -80,9 +82,9 @@ QLineEdit:focus, QPlainTextEdit:focus, QTextEdit:focus, QSpinBox:focus, QComboBo
   border-color: #1a73e8;
 }
 QComboBox::drop-down { border: none; padding-right: 8px; }
-QListWidget::item { padding: 6px 8px; border-radius: 4px; }
-QListWidget::item:selected { background-color: #e8eaed; color: #202124; }
-QListWidget::item:hover:!selected { background-color: #f1f3f4; }
+QListWidget::item, QListView[panelList="true"]::item { padding: 6px 8px; border-radius: 4px; }
+QListWidget::item:selected, QListView[panelList="true"]::item:selected { background-color: #e8eaed; color: #202124; }
+QListWidget::item:hover:!selected, QListView[panelList="true"]::item:hover:!selected { background-color: #f1f3f4; }
 
 QPushButton {
   background-color: #fff; color: #202124; border: 1px solid #dadce0;
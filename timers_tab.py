@@ -1,4 +1,5 @@
 from __future__ import annotations
+import math
 from PySide6 import QtWidgets, QtCore
 
 class TimersTab(QtWidgets.QWidget):
@@ -20,11 +21,14 @@ class TimersTab(QtWidgets.QWidget):
         v.addWidget(gb)
 
         self._sec = 0
+        # Time shown comes from a monotonic clock, so late ticks never lose seconds.
+        self._base_ms = 0  # elapsed before the current run
+        self._clock = QtCore.QElapsedTimer()
         self._t = QtCore.QTimer(self)
         self._t.setInterval(1000)
         self._t.timeout.connect(self._tick)
-        self.btnStart.clicked.connect(self._t.start)
-        self.btnStop .clicked.connect(self._t.stop)
+        self.btnStart.clicked.connect(self._start)
+        self.btnStop .clicked.connect(self._stop)
         self.btnReset.clicked.connect(self._reset)
 
         # Named timers table
@@ -48,13 +52,30 @@ class TimersTab(QtWidgets.QWidget):
         self.btnDel.clicked.connect(self._delete_selected)
 
     # --- Round timer ---
+    def _start(self):
+        if not self._t.isActive():
+            self._clock.start()
+            self._t.start()
+
+    def _stop(self):
+        if self._t.isActive():
+            self._base_ms += self._clock.elapsed()
+            self._t.stop()
+            self._tick()
+
     def _tick(self):
-        self._sec += 1
-        m, s = divmod(self._sec, 60)
-        self.lblRound.setText(f"{m:02d}:{s:02d}")
+        ms = self._base_ms + (self._clock.elapsed() if self._t.isActive() else 0)
+        sec = ms // 1000  # whole seconds elapsed
+        if sec != self._sec:
+            self._sec = sec
+            m, s = divmod(sec, 60)
+            self.lblRound.setText(f"{m:02d}:{s:02d}")
 
     def _reset(self):
         self._sec = 0
+        self._base_ms = 0
+        if self._t.isActive():
+            self._clock.restart()
         self.lblRound.setText("00:00")
 
     # --- Named timers ---
@@ -75,33 +96,51 @@ class TimersTab(QtWidgets.QWidget):
         self.table.setCellWidget(r,4,btnRe)
 
         # Model
-        rec = {"sec":0, "mode":"stopwatch", "t":QtCore.QTimer(self)}
+        # base_ms: stopwatch time before this run, or countdown time left at its start
+        rec = {"sec":0, "mode":"stopwatch", "t":QtCore.QTimer(self),
+               "base_ms":0, "clock":QtCore.QElapsedTimer(), "paused":False}
         rec["t"].setInterval(1000)
-        def tick():
+        def current_ms():
+            run = rec["clock"].elapsed() if rec["t"].isActive() else 0
             if mode.currentText()=="stopwatch":
-                rec["sec"] += 1
-            else:
-                rec["sec"] = max(0, rec["sec"] - 1)
-            m, s = divmod(rec["sec"], 60)
-            time.setTime(QtCore.QTime(0, m, s))
-            if mode.currentText()=="countdown" and rec["sec"]==0:
-                rec["t"].stop()
+                return rec["base_ms"] + run
+            return max(0, rec["base_ms"] - run)
+        def tick():
+            ms = current_ms()
+            countdown = mode.currentText()=="countdown"
+            # a countdown shows time left rounded up, so 00:00 only once it is over
+            sec = math.ceil(ms / 1000) if countdown else ms // 1000
+            if sec != rec["sec"]:
+                rec["sec"] = sec
+                m, s = divmod(sec, 60)
+                time.setTime(QtCore.QTime(0, m, s))
+            if countdown and sec==0:
+                rec["t"].stop(); btnGo.setText("Start")
         rec["t"].timeout.connect(tick)
 
         def start_stop():
             if rec["t"].isActive():
+                rec["base_ms"] = current_ms()
+                rec["paused"] = True
                 rec["t"].stop(); btnGo.setText("Start")
+                tick()
             else:
-                # initialize from editor for countdown
-                if mode.currentText()=="countdown":
-                    mm = time.time().minute(); ss = time.time().second()
+                # initialize from editor for countdown, unless resuming with the time untouched
+                mm = time.time().minute(); ss = time.time().second()
+                resuming = rec["paused"] and mm*60 + ss == rec["sec"]
+                if mode.currentText()=="countdown" and not resuming:
                     rec["sec"] = mm*60 + ss
+                    rec["base_ms"] = rec["sec"] * 1000
+                rec["paused"] = False
+                rec["clock"].start()
                 btnGo.setText("Stop"); rec["t"].start()
         btnGo.clicked.connect(start_stop)
 
         def reset():
             rec["t"].stop(); btnGo.setText("Start")
             rec["sec"] = 0
+            rec["base_ms"] = 0
+            rec["paused"] = False
             time.setTime(QtCore.QTime(0,0))
         btnRe.clicked.connect(reset)
 
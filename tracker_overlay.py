@@ -32,7 +32,7 @@ from app_paths import (
     OVERLAY_LOG_FILE,
 )
 from combat_metrics import metric_values, resolve_combat_metric, resolve_secondary_combat_metric
-from helpers import config_bool, config_choice
+from helpers import config_bool, config_choice, json_loads
 from layout_helpers import status_badge_rows
 from overlay_theme import load_overlay_theme, overlay_region_rect
 from portrait_library import (
@@ -126,31 +126,38 @@ def normalize_enemy_health_disclosure(value) -> str:
     return config_choice(value, ENEMY_HEALTH_DISCLOSURES, "condition")
 
 
+_COMBAT_DENSITY_ROOMY = {
+    "padding": 10,
+    "gap": 6,
+    "portrait_size": 56,
+    "font_reduction": 0,
+    "condition_rows": 2,
+}
+_COMBAT_DENSITY_MEDIUM = {
+    "padding": 8,
+    "gap": 5,
+    "portrait_size": 48,
+    "font_reduction": 1,
+    "condition_rows": 2,
+}
+_COMBAT_DENSITY_COMPACT = {
+    "padding": 6,
+    "gap": 4,
+    "portrait_size": 38,
+    "font_reduction": 2,
+    "condition_rows": 1,
+}
+
+
 def combat_density(combatant_count: int) -> dict[str, int]:
-    """Return bounded presentation density without changing combat data."""
+    """Return bounded presentation density without changing combat data.
+
+    The returned dicts are shared module constants; treat them as read-only."""
     if combatant_count <= 2:
-        return {
-            "padding": 10,
-            "gap": 6,
-            "portrait_size": 56,
-            "font_reduction": 0,
-            "condition_rows": 2,
-        }
+        return _COMBAT_DENSITY_ROOMY
     if combatant_count <= 5:
-        return {
-            "padding": 8,
-            "gap": 5,
-            "portrait_size": 48,
-            "font_reduction": 1,
-            "condition_rows": 2,
-        }
-    return {
-        "padding": 6,
-        "gap": 4,
-        "portrait_size": 38,
-        "font_reduction": 2,
-        "condition_rows": 1,
-    }
+        return _COMBAT_DENSITY_MEDIUM
+    return _COMBAT_DENSITY_COMPACT
 
 
 def enemy_health_descriptor(combatant) -> str:
@@ -446,8 +453,8 @@ class Overlay(QWidget):
         try:
             mtime = os.path.getmtime(PARTY_FP)
             if mtime > self.last_party_mod:
-                with open(PARTY_FP, "r") as f:
-                    data = json.load(f)
+                with open(PARTY_FP, "rb") as f:
+                    data = json_loads(f.read())
                     self.combatants = data.get("party", [])
                     self.turn_index = data.get("turn_index", -1)
                     self.round = data.get("round", 1)
@@ -466,8 +473,8 @@ class Overlay(QWidget):
         try:
             cfg_m = os.path.getmtime(CONFIG_FP)
             if cfg_m > self.last_cfg_mod:
-                with open(CONFIG_FP, "r", encoding="utf-8") as f:
-                    cfg = json.load(f)
+                with open(CONFIG_FP, "rb") as f:
+                    cfg = json_loads(f.read())
                 ov = cfg.get("overlay") or {}
                 poll_ms = max(100, int(cfg.get("poll_ms", 200)))
                 auto = bool(cfg.get("auto_refresh", True))
@@ -544,8 +551,8 @@ class Overlay(QWidget):
         try:
             blocks_mtime = os.path.getmtime(DIALOG_BLOCKS)
             if blocks_mtime > getattr(self, "last_dialog_blocks_mod", 0):
-                with open(DIALOG_BLOCKS, "r", encoding="utf-8") as source:
-                    blocks = json.load(source)
+                with open(DIALOG_BLOCKS, "rb") as source:
+                    blocks = json_loads(source.read())
                 if not isinstance(blocks, list) or not all(
                     isinstance(block, dict) for block in blocks
                 ):
@@ -562,8 +569,8 @@ class Overlay(QWidget):
 
         try:
             mtime = os.path.getmtime(DIALOG_FP.with_suffix(".json"))
-            with open(DIALOG_FP.with_suffix(".json"), "r") as f:
-                data = json.load(f)
+            with open(DIALOG_FP.with_suffix(".json"), "rb") as f:
+                data = json_loads(f.read())
                 new_idx = data.get("index", -1)
                 # Reset typing effect if dialog index changed
                 if new_idx != self.dialog_idx:
@@ -627,8 +634,8 @@ class Overlay(QWidget):
         entities = list(self.combatants)
         for source in ROSTERS_DIR.glob("*.json"):
             try:
-                with open(source, "r", encoding="utf-8") as stream:
-                    document = json.load(stream)
+                with open(source, "rb") as stream:
+                    document = json_loads(stream.read())
             except (OSError, UnicodeError, json.JSONDecodeError):
                 continue
             if isinstance(document, list):